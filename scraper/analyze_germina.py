@@ -1,67 +1,78 @@
 #!/usr/bin/env python3
-import json
+import io
+import sys
 
-with open('scraper_data/json_files/germina_seeds/germina_ca_organic_seeds_20250605_090211.json', 'r') as f:
-    data = json.load(f)
+import numpy as np
+import orjson
+import pandas as pd
 
-print('🇨🇦 GERMINA.CA REGEX PARSING ANALYSIS 🇨🇦')
-print('=' * 50)
+with open('scraper_data/json_files/germina_seeds/germina_ca_organic_seeds_20250605_090211.json', 'rb') as f:
+    data = orjson.loads(f.read())
 
-french_titles = []
-multi_word_cultivars = []
-complex_names = []
+# Accumulate the whole report in memory and emit it with one write at the
+# end, instead of ~30 line-buffered print calls
+buf = io.StringIO()
+w = buf.write
 
-for product in data['data']:
-    title = product['title']
-    common = product['common_name']
-    cultivar = product['cultivar_name']
-    
-    if 'biologique' in title.lower():
-        french_titles.append((title, common, cultivar))
-    
-    if cultivar and cultivar != 'N/A' and ' ' in cultivar:
-        multi_word_cultivars.append((title, common, cultivar))
-    
-    if len(title.split()) >= 3:
-        complex_names.append((title, common, cultivar))
+w('🇨🇦 GERMINA.CA REGEX PARSING ANALYSIS 🇨🇦\n')
+w('=' * 50 + '\n')
 
-print('SAMPLE FRENCH TITLES:')
-print('-' * 22)
-for title, common, cultivar in french_titles[:3]:
-    print(f'Title: "{title}"')
-    print(f'  → Common: "{common}" | Cultivar: "{cultivar}"')
-    print('  ✅ French title parsed correctly')
-    print()
+# Vectorized filtering: one DataFrame pass instead of a per-product Python loop
+df = pd.DataFrame(data['data'])
 
-print('MULTI-WORD CULTIVARS:')
-print('-' * 22)
-for title, common, cultivar in multi_word_cultivars[:5]:
-    print(f'Title: "{title}"')
-    print(f'  → Common: "{common}" | Cultivar: "{cultivar}"')
-    print('  ✅ Multi-word cultivar extracted')
-    print()
+mask_french = df['title'].str.lower().str.contains('biologique', na=False)
+mask_multi_word = (
+    df['cultivar_name'].fillna('').str.contains(' ', regex=False)
+    & df['cultivar_name'].ne('N/A')
+)
+# Counting separators is one C-level scan per title; str.split would
+# allocate a token list per row just to take its length
+mask_complex = df['title'].str.count(' ') >= 2
 
-print('COMPLEX ORGANIC NAMES:')
-print('-' * 23)
-for title, common, cultivar in complex_names[:5]:
-    print(f'Title: "{title}"')
-    print(f'  → Common: "{common}" | Cultivar: "{cultivar}"')
-    print('  ✅ Complex name parsed')
-    print()
+name_columns = ['title', 'common_name', 'cultivar_name']
+french_titles = df.loc[mask_french, name_columns]
+multi_word_cultivars = df.loc[mask_multi_word, name_columns]
+complex_names = df.loc[mask_complex, name_columns]
 
-# Quality metrics
-total = len(data['data'])
-clean_count = sum(1 for p in data['data'] if not p['common_name'].endswith(','))
+w('SAMPLE FRENCH TITLES:\n')
+w('-' * 22 + '\n')
+for row in french_titles.head(3).itertuples(index=False):
+    w(f'Title: "{row.title}"\n')
+    w(f'  → Common: "{row.common_name}" | Cultivar: "{row.cultivar_name}"\n')
+    w('  ✅ French title parsed correctly\n\n')
+
+w('MULTI-WORD CULTIVARS:\n')
+w('-' * 22 + '\n')
+for row in multi_word_cultivars.head(5).itertuples(index=False):
+    w(f'Title: "{row.title}"\n')
+    w(f'  → Common: "{row.common_name}" | Cultivar: "{row.cultivar_name}"\n')
+    w('  ✅ Multi-word cultivar extracted\n\n')
+
+w('COMPLEX ORGANIC NAMES:\n')
+w('-' * 23 + '\n')
+for row in complex_names.head(5).itertuples(index=False):
+    w(f'Title: "{row.title}"\n')
+    w(f'  → Common: "{row.common_name}" | Cultivar: "{row.cultivar_name}"\n')
+    w('  ✅ Complex name parsed\n\n')
+
+# Quality metrics (vectorized reductions instead of generator scans).
+# The trailing-comma scan runs as a numpy char kernel over a fixed-width
+# string array rather than an object-dtype pandas pass.
+total = len(df)
+common_names = df['common_name'].to_numpy(dtype=str)
+clean_count = int((~np.char.endswith(common_names, ',')).sum())
 trailing_comma_issues = total - clean_count
 
-print('FINAL RESULTS SUMMARY:')
-print('=' * 25)
-print(f'✅ Total products: {total}')
-print(f'✅ Clean parsing: {clean_count}/{total} ({100*clean_count/total:.1f}%)')
-print(f'✅ Trailing comma issues: {trailing_comma_issues}')
-print(f'✅ French titles handled: {len(french_titles)}')
-print(f'✅ Multi-word cultivars: {len(multi_word_cultivars)}')
-print(f'✅ Complex names: {len(complex_names)}')
-print()
-print('🎉 PERFECT SUCCESS: All regex parsing issues resolved!')
-print('🌱 Germina.ca data shows excellent multilingual support!')
\ No newline at end of file
+w('FINAL RESULTS SUMMARY:\n')
+w('=' * 25 + '\n')
+w(f'✅ Total products: {total}\n')
+w(f'✅ Clean parsing: {clean_count}/{total} ({100*clean_count/total:.1f}%)\n')
+w(f'✅ Trailing comma issues: {trailing_comma_issues}\n')
+w(f'✅ French titles handled: {len(french_titles)}\n')
+w(f'✅ Multi-word cultivars: {len(multi_word_cultivars)}\n')
+w(f'✅ Complex names: {len(complex_names)}\n')
+w('\n')
+w('🎉 PERFECT SUCCESS: All regex parsing issues resolved!\n')
+w('🌱 Germina.ca data shows excellent multilingual support!\n')
+
+sys.stdout.write(buf.getvalue())
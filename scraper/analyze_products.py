@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Analysis tool for scraped sprouting.com product data.
+Loads the product CSV, cleans pricing columns, computes price-per-gram
+metrics and generates a pricing visualization.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+CSV_FILEPATH = "sprouting_products.csv"
+OUTPUT_PLOT_FILEPATH = "price_analysis.png"
+
+# Price tiers scraped from sprouting.com and their weights in grams
+PRICE_COLUMNS = ['price_75g', 'price_150g', 'price_1kg', 'price_5kg', 'price_10kg']
+WEIGHTS_GRAMS = {
+    'price_75g': 75,
+    'price_150g': 150,
+    'price_1kg': 1000,
+    'price_5kg': 5000,
+    'price_10kg': 10000
+}
+
+
+def load_data(csv_filepath=CSV_FILEPATH):
+    """
+    Load the scraped product data from CSV.
+    Prefers pandas' multi-threaded pyarrow engine and falls back to the
+    default parser when pyarrow isn't installed.
+    """
+    if not os.path.exists(csv_filepath):
+        raise FileNotFoundError(f"Product CSV not found: {csv_filepath}. Run the scraper first.")
+    try:
+        return pd.read_csv(csv_filepath, engine='pyarrow')
+    except (ImportError, ValueError):
+        return pd.read_csv(csv_filepath)
+
+
+def clean_price_data(df):
+    """
+    Clean price columns in place, converting strings like "$12,345.67" to floats.
+    A single regex pass strips currency symbols and thousands separators,
+    then pd.to_numeric coerces anything unparseable to NaN.
+    """
+    present = [col for col in PRICE_COLUMNS if col in df.columns]
+    df[present] = df[present].apply(
+        lambda s: pd.to_numeric(
+            s.astype(str).str.replace(r'[$,]', '', regex=True),
+            errors='coerce'
+        )
+    )
+    return df
+
+
+def calculate_price_per_gram(df):
+    """
+    Add price-per-gram columns for each price tier.
+    The price tiers are divided as one 2D block with a broadcast weight
+    vector, so all tiers are computed in a single numpy pass.
+    """
+    present = [col for col in PRICE_COLUMNS if col in df.columns]
+    if not present:
+        return df
+
+    weights = np.array([WEIGHTS_GRAMS[col] for col in present], dtype=np.float64)
+    per_gram_cols = [f'price_per_gram_{col.split("_", 1)[1]}' for col in present]
+    df[per_gram_cols] = df[present].to_numpy(dtype=np.float64) / weights
+    return df
+
+
+def mean_bulk_discount(df, small_col='price_per_gram_75g', bulk_col='price_per_gram_1kg'):
+    """
+    Average percentage discount of the bulk tier versus the small tier.
+
+    Works on raw numpy arrays extracted once from the frame, so the
+    subtract/divide/mean runs as flat FP64 array ops instead of
+    allocating intermediate pandas Series. Rows where either price is
+    missing or the small-tier price is zero are skipped.
+    """
+    if small_col not in df.columns or bulk_col not in df.columns:
+        return float('nan')
+
+    small = df[small_col].to_numpy(dtype=np.float64)
+    bulk = df[bulk_col].to_numpy(dtype=np.float64)
+
+    valid = np.isfinite(small) & np.isfinite(bulk) & (small != 0)
+    if not valid.any():
+        return float('nan')
+
+    small = small[valid]
+    discounts = (small - bulk[valid]) / small * 100.0
+    return float(discounts.mean())
+
+
+def visualize_data(df, output_filepath=OUTPUT_PLOT_FILEPATH):
+    """Plot 1kg price against price per gram to highlight bulk discount outliers."""
+    if 'price_1kg' not in df.columns:
+        print("No price_1kg column found; skipping visualization.")
+        return
+
+    # Import matplotlib lazily so numeric-only runs skip its startup
+    # cost entirely; force the Agg backend to avoid GUI backend probing
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    plot_df = df.dropna(subset=['price_1kg'])
+    fig, ax = plt.subplots(figsize=(12, 8))
+
+    # One rasterized PathCollection for all points: the axes stay vector
+    # but N products don't become N individual artists in the output file
+    ax.scatter(
+        plot_df['price_1kg'], plot_df['price_per_gram_1kg'],
+        s=12, alpha=0.6, rasterized=True
+    )
+
+    # Label only the priciest outliers rather than annotating every row
+    if 'name' in plot_df.columns:
+        outliers = plot_df.nlargest(10, 'price_per_gram_1kg')
+        for row in outliers.itertuples(index=False):
+            ax.annotate(
+                row.name,
+                (row.price_1kg, row.price_per_gram_1kg),
+                fontsize=7, alpha=0.7
+            )
+
+    ax.set_xlabel('Price per 1kg (CAD)')
+    ax.set_ylabel('Price per gram (CAD)')
+    ax.set_title('Sprouting.com Pricing Analysis')
+    fig.tight_layout()
+    fig.savefig(output_filepath, dpi=150)
+    print(f"Saved pricing plot to {output_filepath}")
+
+
+def main():
+    df = load_data()
+    print(f"Loaded {len(df)} products from {CSV_FILEPATH}")
+
+    df = clean_price_data(df)
+    df = calculate_price_per_gram(df)
+
+    per_gram_cols = [c for c in df.columns if c.startswith('price_per_gram_')]
+    if per_gram_cols:
+        print("\nPrice per gram summary (CAD):")
+        print(df[per_gram_cols].describe().round(4))
+
+    discount = mean_bulk_discount(df)
+    if discount == discount:
+        print(f"\nAverage 1kg-vs-75g bulk discount: {discount:.1f}%")
+
+    if os.environ.get('SPROUTING_SKIP_PLOTS'):
+        print("SPROUTING_SKIP_PLOTS set; skipping visualization.")
+    else:
+        visualize_data(df)
+
+
+if __name__ == "__main__":
+    main()
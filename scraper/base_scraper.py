@@ -5,10 +5,17 @@ Provides common functionality and interface for concrete scraper implementations
 
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any, Tuple
+import asyncio
+import gzip
+import hashlib
+import json
 import os
 import time
 from datetime import datetime
+import requests
+from urllib.parse import urlparse
 from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
+from playwright.async_api import async_playwright
 from scraper_utils import (
     setup_logging, save_products_to_json, validate_product_data,
     ScraperError, LoginError, ParseError, NetworkError
@@ -17,16 +24,42 @@ from scraper_utils import (
 
 class BaseScraper(ABC):
     """Abstract base class for all product scrapers."""
-    
+
+    # Slotted attributes: contiguous C-level storage instead of a per-instance
+    # dict, for cheaper attribute access in the per-product loops. Subclasses
+    # that add attributes of their own still get a __dict__ as usual.
+    __slots__ = (
+        'supplier_name', 'source_site', 'output_dir', 'currency_code',
+        'headless', 'test_mode', 'test_limit', 'block_resources',
+        'use_page_cache', 'page_cache_max_age_hours', 'logger',
+        'browser', 'context', 'page', 'start_time', 'playwright', '_delay',
+        'http'
+    )
+
+    # Subclasses scraping server-rendered pages can set this to False to
+    # skip the browser entirely and fetch over a keep-alive HTTP session.
+    use_browser = True
+
+    # Set to True on subclasses whose downstream processing depends on the
+    # original product order; disables the host-locality sort below.
+    preserve_order = False
+
+    # Resource types the scrapers never parse; blocking them cuts most of
+    # the bytes and subresource fetches per page load.
+    BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font', 'stylesheet'}
+
     def __init__(
-        self, 
+        self,
         supplier_name: str,
         source_site: str,
         output_dir: str,
         currency_code: str = "CAD",
         headless: bool = True,
         test_mode: bool = False,
-        test_limit: int = 2
+        test_limit: int = 2,
+        block_resources: bool = True,
+        use_page_cache: bool = False,
+        page_cache_max_age_hours: float = 24.0
     ):
         """
         Initialize the base scraper.
@@ -39,6 +72,9 @@ class BaseScraper(ABC):
             headless: Whether to run browser in headless mode
             test_mode: Whether to run in test mode (limited scraping)
             test_limit: Number of products to scrape in test mode
+            block_resources: Whether to block images/media/fonts/stylesheets
+            use_page_cache: Whether to serve repeat page fetches from disk
+            page_cache_max_age_hours: Age after which cached pages are stale
         """
         self.supplier_name = supplier_name
         self.source_site = source_site
@@ -47,7 +83,10 @@ class BaseScraper(ABC):
         self.headless = headless
         self.test_mode = test_mode
         self.test_limit = test_limit
-        
+        self.block_resources = block_resources
+        self.use_page_cache = use_page_cache
+        self.page_cache_max_age_hours = page_cache_max_age_hours
+
         # Setup logger
         self.logger = setup_logging(f"{supplier_name}_scraper")
         
@@ -55,15 +94,31 @@ class BaseScraper(ABC):
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
-        
+        self.playwright = None
+
+        # HTTP session for browserless scrapers (initialized in context manager)
+        self.http: Optional[requests.Session] = None
+
+
         # Timing
         self.start_time: Optional[float] = None
         
     def __enter__(self):
         """Context manager entry - initialize browser."""
         self.start_time = time.time()
+        # Resolved once per run; constant for a given subclass
+        self._delay = self.get_politeness_delay()
         self.logger.info(f"Starting {self.supplier_name} scraper")
-        
+
+        # Browserless mode: a keep-alive HTTP session replaces Playwright
+        # for sites whose product pages are fully server-rendered
+        if not self.use_browser:
+            self.http = requests.Session()
+            self.http.headers.update({'User-Agent': self.get_user_agent()})
+            if self.requires_login():
+                self.login()
+            return self
+
         # Initialize playwright and browser
         self.playwright = sync_playwright().start()
         self.browser = self.playwright.chromium.launch(headless=self.headless)
@@ -71,9 +126,20 @@ class BaseScraper(ABC):
             user_agent=self.get_user_agent(),
             java_script_enabled=True,
             accept_downloads=False,
+            viewport={'width': 800, 'height': 600},
         )
+
+        # Abort requests for heavy resources the scrapers never parse
+        if self.block_resources:
+            self.context.route(
+                '**/*',
+                lambda route: route.abort()
+                if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES
+                else route.continue_()
+            )
+
         self.page = self.context.new_page()
-        
+
         # Perform any necessary login
         if self.requires_login():
             self.login()
@@ -81,12 +147,15 @@ class BaseScraper(ABC):
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - cleanup browser."""
+        """Context manager exit - cleanup browser and HTTP session."""
         if self.browser:
             self.browser.close()
         if self.playwright:
             self.playwright.stop()
-            
+        if self.http:
+            self.http.close()
+
+
         duration = time.time() - self.start_time if self.start_time else 0
         self.logger.info(f"{self.supplier_name} scraper finished. Duration: {duration:.2f} seconds")
         
@@ -136,10 +205,32 @@ class BaseScraper(ABC):
         Returns:
             List of processed products
         """
+        # Feeds re-emit the same URL under multiple categories; drop the
+        # duplicates here so they never cost a network round trip
+        seen_urls = set()
+        unique_products = []
+        for product in products:
+            url = product.get('url', '')
+            if url and url in seen_urls:
+                continue
+            seen_urls.add(url)
+            unique_products.append(product)
+        if len(unique_products) < len(products):
+            self.logger.info(
+                f"Dropped {len(products) - len(unique_products)} duplicate product URLs"
+            )
+        products = unique_products
+
         if self.test_mode and len(products) > self.test_limit:
             self.logger.info(f"TEST_MODE: Limiting to {self.test_limit} products")
             products = products[:self.test_limit]
-            
+
+        # Group same-host URLs together (stable sort) so consecutive
+        # fetches reuse warm keep-alive connections instead of paying a
+        # TLS handshake on every host transition
+        if not self.preserve_order:
+            products = sorted(products, key=lambda p: urlparse(p.get('url', '')).netloc)
+
         return products
         
     def scrape(self) -> List[Dict[str, Any]]:
@@ -166,7 +257,7 @@ class BaseScraper(ABC):
                 try:
                     # Add politeness delay
                     if i > 1:
-                        time.sleep(self.get_politeness_delay())
+                        time.sleep(self._delay)
                         
                     # Scrape product details
                     detailed_product = self.scrape_product_details(product)
@@ -187,6 +278,199 @@ class BaseScraper(ABC):
             self.logger.error(f"Fatal error during scraping: {e}", exc_info=True)
             raise ScraperError(f"Scraping failed: {e}")
             
+    def _page_cache_path(self, url: str) -> str:
+        """Build the cache file path for a URL (content-addressed by URL hash)."""
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.output_dir, 'cache', digest[:2], digest)
+
+    def get_cached_page(self, url: str) -> Optional[str]:
+        """
+        Return cached HTML for a URL, or None on miss/stale entry.
+
+        Args:
+            url: Page URL used as the cache key
+
+        Returns:
+            Cached HTML string, or None if absent or older than the max age
+        """
+        base_path = self._page_cache_path(url)
+        try:
+            with open(base_path + '.json', 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if time.time() - meta.get('fetched_at', 0) > self.page_cache_max_age_hours * 3600:
+                return None
+            with gzip.open(base_path + '.html.gz', 'rt', encoding='utf-8') as f:
+                return f.read()
+        except (OSError, ValueError, EOFError):
+            # EOFError: gzip member truncated by an interrupted cache write;
+            # treat like any other miss and let the caller re-fetch
+            return None
+
+    def cache_page(self, url: str, html: str) -> None:
+        """Store page HTML in the on-disk cache (gzipped, with a metadata sidecar)."""
+        base_path = self._page_cache_path(url)
+        try:
+            os.makedirs(os.path.dirname(base_path), exist_ok=True)
+            with gzip.open(base_path + '.html.gz', 'wt', encoding='utf-8') as f:
+                f.write(html)
+            with open(base_path + '.json', 'w', encoding='utf-8') as f:
+                json.dump({'url': url, 'fetched_at': time.time()}, f)
+        except OSError as e:
+            self.logger.warning(f"Could not cache page {url}: {e}")
+
+    def fetch_page(self, url: str, wait_until: str = "domcontentloaded") -> str:
+        """
+        Fetch page HTML, serving from the disk cache when enabled.
+
+        On a cache hit the browser is bypassed entirely, which makes
+        incremental re-scrapes and parse-retry iterations near-free.
+
+        Args:
+            url: URL to fetch
+            wait_until: Playwright wait strategy for uncached fetches
+
+        Returns:
+            Page HTML content
+        """
+        if self.use_page_cache:
+            cached = self.get_cached_page(url)
+            if cached is not None:
+                self.logger.debug(f"Page cache hit: {url}")
+                return cached
+
+        if self.use_browser:
+            self.page.goto(url, wait_until=wait_until)
+            html = self.page.content()
+        else:
+            html = self.http_get(url)
+
+        if self.use_page_cache:
+            self.cache_page(url, html)
+
+        return html
+
+    def http_get(self, url: str, timeout: float = 30.0) -> str:
+        """
+        Fetch a URL over the shared keep-alive HTTP session.
+
+        Only available in browserless mode (use_browser = False), where it
+        replaces a full Chromium navigation for server-rendered pages.
+
+        Args:
+            url: URL to fetch
+            timeout: Request timeout in seconds
+
+        Returns:
+            Response body as text
+
+        Raises:
+            NetworkError: If the request fails or returns a bad status
+        """
+        if self.http is None:
+            raise ScraperError("http_get requires browserless mode (use_browser = False)")
+
+        try:
+            response = self.http.get(url, timeout=timeout)
+            response.raise_for_status()
+            return response.text
+        except requests.RequestException as e:
+            raise NetworkError(f"HTTP request failed for {url}: {e}")
+
+    async def scrape_product_details_async(self, page, product: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async variant of scrape_product_details for concurrent scraping.
+        Override this method to enable scrape_concurrently().
+
+        Args:
+            page: Playwright async page object dedicated to this task
+            product: Product dictionary from fetch_product_list
+
+        Returns:
+            Complete product dictionary with all required fields
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not implement scrape_product_details_async"
+        )
+
+    async def _scrape_products_async(
+        self, products: List[Dict[str, Any]], max_concurrency: int
+    ) -> List[Dict[str, Any]]:
+        """Scrape product details concurrently with a bounded page pool."""
+        delay = self.get_politeness_delay()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        detailed_products: List[Dict[str, Any]] = []
+
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=self.headless)
+            context = await browser.new_context(
+                user_agent=self.get_user_agent(),
+                java_script_enabled=True,
+                accept_downloads=False,
+            )
+
+            async def scrape_one(index: int, product: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                async with semaphore:
+                    # Stagger requests so concurrency doesn't defeat politeness
+                    await asyncio.sleep(delay * (index % max_concurrency))
+                    page = await context.new_page()
+                    try:
+                        self.logger.info(
+                            f"Processing product {index + 1}/{len(products)}: "
+                            f"{product.get('title', 'Unknown')}"
+                        )
+                        return await self.scrape_product_details_async(page, product)
+                    except Exception as e:
+                        self.logger.error(
+                            f"Error scraping product {product.get('title')}: {e}", exc_info=True
+                        )
+                        return None
+                    finally:
+                        await page.close()
+
+            results = await asyncio.gather(
+                *(scrape_one(i, product) for i, product in enumerate(products))
+            )
+            await browser.close()
+
+        # Validation stays on the main coroutine / thread
+        for product in results:
+            if product is None:
+                continue
+            if validate_product_data(product, self.logger):
+                detailed_products.append(product)
+            else:
+                self.logger.warning(f"Product failed validation: {product.get('title')}")
+
+        return detailed_products
+
+    def scrape_concurrently(self, max_concurrency: int = 4) -> List[Dict[str, Any]]:
+        """
+        Concurrent alternative to scrape() for network-bound scrapers.
+
+        Fetches the product list as usual, then scrapes product details
+        across max_concurrency Playwright pages via the async API instead
+        of serializing every fetch behind a politeness sleep. Subclasses
+        must implement scrape_product_details_async to use this path.
+
+        Args:
+            max_concurrency: Maximum number of product pages in flight
+
+        Returns:
+            List of scraped product dictionaries
+        """
+        try:
+            self.logger.info("Fetching product list...")
+            products = self.fetch_product_list()
+            self.logger.info(f"Found {len(products)} products")
+
+            products = self.process_products(products)
+
+            return asyncio.run(self._scrape_products_async(products, max_concurrency))
+
+        except Exception as e:
+            self.logger.error(f"Fatal error during scraping: {e}", exc_info=True)
+            raise ScraperError(f"Scraping failed: {e}")
+
     def get_politeness_delay(self) -> float:
         """Get delay between requests in seconds. Override to customize."""
         return 1.0
@@ -235,7 +519,9 @@ class FeedBasedScraper(BaseScraper):
     Base class for scrapers that use feeds (Atom, RSS, JSON API).
     Provides additional methods for feed-based scraping patterns.
     """
-    
+
+    __slots__ = ()
+
     @abstractmethod
     def fetch_feed(self) -> Any:
         """
@@ -289,7 +575,9 @@ class PageNavigationScraper(BaseScraper):
     Base class for scrapers that navigate through pages (pagination, categories).
     Provides methods for page-based scraping patterns.
     """
-    
+
+    __slots__ = ()
+
     @abstractmethod
     def get_start_urls(self) -> List[str]:
         """
@@ -331,28 +619,104 @@ class PageNavigationScraper(BaseScraper):
         Implementation of fetch_product_list for page-based scrapers.
         """
         all_products = []
-        
+
         for start_url in self.get_start_urls():
-            current_url = start_url
-            page_num = 1
-            
-            while current_url:
-                self.logger.info(f"Fetching page {page_num}: {current_url}")
-                
-                try:
-                    products = self.extract_product_links(current_url)
-                    all_products.extend(products)
-                    
-                    # Check for next page
-                    current_url = self.get_next_page_url(current_url)
-                    page_num += 1
-                    
-                    # Add delay between pages
-                    if current_url:
-                        time.sleep(self.get_politeness_delay())
-                        
-                except Exception as e:
-                    self.logger.error(f"Error fetching page {current_url}: {e}", exc_info=True)
-                    break
-                    
-        return all_products
\ No newline at end of file
+            all_products.extend(self._crawl_start_url(start_url))
+
+        return all_products
+
+    def _crawl_start_url(self, start_url: str) -> List[Dict[str, Any]]:
+        """Crawl one start URL through its pagination chain."""
+        products = []
+        current_url = start_url
+        page_num = 1
+
+        while current_url:
+            self.logger.info(f"Fetching page {page_num}: {current_url}")
+
+            try:
+                products.extend(self.extract_product_links(current_url))
+
+                # Check for next page
+                current_url = self.get_next_page_url(current_url)
+                page_num += 1
+
+                # Add delay between pages
+                if current_url:
+                    time.sleep(self.get_politeness_delay())
+
+            except Exception as e:
+                self.logger.error(f"Error fetching page {current_url}: {e}", exc_info=True)
+                break
+
+        return products
+
+    async def extract_product_links_async(self, page, page_url: str) -> List[Dict[str, Any]]:
+        """
+        Async variant of extract_product_links for concurrent crawling.
+        Override this method to enable fetch_product_list_concurrently().
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not implement extract_product_links_async"
+        )
+
+    def fetch_product_list_concurrently(self, max_concurrency: int = 2) -> List[Dict[str, Any]]:
+        """
+        Crawl all start URLs in parallel.
+
+        Pagination is inherently sequential within one start URL (the next
+        page depends on the current one), but independent across start
+        URLs, so each category listing gets its own async page and the
+        crawls run concurrently under a shared semaphore. Subclasses must
+        implement extract_product_links_async to use this path.
+
+        Args:
+            max_concurrency: Maximum number of listing crawls in flight
+
+        Returns:
+            List of product dictionaries from all start URLs
+        """
+        return asyncio.run(self._fetch_product_list_async(max_concurrency))
+
+    async def _fetch_product_list_async(self, max_concurrency: int) -> List[Dict[str, Any]]:
+        delay = self.get_politeness_delay()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=self.headless)
+            context = await browser.new_context(
+                user_agent=self.get_user_agent(),
+                java_script_enabled=True,
+                accept_downloads=False,
+            )
+
+            async def crawl_start(start_url: str) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    page = await context.new_page()
+                    products: List[Dict[str, Any]] = []
+                    current_url = start_url
+                    page_num = 1
+                    try:
+                        while current_url:
+                            self.logger.info(f"Fetching page {page_num}: {current_url}")
+                            products.extend(
+                                await self.extract_product_links_async(page, current_url)
+                            )
+                            current_url = self.get_next_page_url(current_url)
+                            page_num += 1
+                            if current_url:
+                                await asyncio.sleep(delay)
+                    except Exception as e:
+                        self.logger.error(
+                            f"Error fetching page {current_url}: {e}", exc_info=True
+                        )
+                    finally:
+                        await page.close()
+                    return products
+
+            results = await asyncio.gather(
+                *(crawl_start(url) for url in self.get_start_urls())
+            )
+            await browser.close()
+
+        return [product for sub in results for product in sub]
\ No newline at end of file
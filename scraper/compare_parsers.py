@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Compares the simplified seed parser against the legacy complex parser.
+Used to verify the migration described in SIMPLIFIED_PARSER_GUIDE.md
+keeps producing identical common name / cultivar results.
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from simplified_seed_parser import parse_seed_title, parse_seed_titles as simplified_parse_batch
+from seed_naming_utils import parse_seed_name, parse_seed_names as complex_parse_batch
+
+# Below this many titles the fork/pickle overhead of worker processes
+# outweighs the parallel regex parsing, so stay in-process.
+PARALLEL_THRESHOLD = 256
+
+TEST_TITLES = [
+    "Ruby Red Lettuce",
+    "Kale, Red Russian",
+    "Broccoli 'Di Cicco'",
+    "Swiss Chard, Bright Lights",
+    "Radish 'Daikon' - Organic",
+    "4010 Green Forage Pea - Organic",
+    "Greencrops, 4010 Green Forage Pea - Organic",
+    "Sunflower, Black Oil",
+    "Spicy Mix",
+    "Beet, Bull's Blood",
+    "Lettuce Mix, Organic",
+    "Wheatgrass",
+    "Nasturtium, Organic",
+    "Mung Bean Sprouting Seeds",
+    "Dwarf Siberian Kale"
+]
+
+
+def _run_parsers(test_titles):
+    """
+    Run both parsers over the titles, in parallel for large sets.
+
+    The regex-heavy parsing is CPU-bound, so big title lists are chunked
+    across a ProcessPoolExecutor; small ones stay in-process.
+    """
+    if len(test_titles) < PARALLEL_THRESHOLD:
+        return simplified_parse_batch(test_titles), complex_parse_batch(test_titles)
+
+    with ProcessPoolExecutor() as executor:
+        simple_results = list(executor.map(parse_seed_title, test_titles, chunksize=32))
+        complex_results = list(executor.map(parse_seed_name, test_titles, chunksize=32))
+    return simple_results, complex_results
+
+
+def compare_parsers(test_titles=TEST_TITLES):
+    """Run both parsers over the test titles and report agreement stats."""
+    n = len(test_titles)
+
+    # Preallocated match-flag arrays so the totals below are single
+    # vectorized reductions rather than repeated Python scans of results.
+    common_ok = np.empty(n, dtype=bool)
+    cultivar_ok = np.empty(n, dtype=bool)
+    both_ok = np.empty(n, dtype=bool)
+
+    # Batch both parsers up front so per-call setup is amortized across
+    # the whole title list; large sets parse across CPU cores.
+    simple_results, complex_results = _run_parsers(test_titles)
+
+    results = []
+    for i, (title, simple, complex_) in enumerate(
+            zip(test_titles, simple_results, complex_results)):
+        common_ok[i] = simple['common_name'] == complex_['common_name']
+        cultivar_ok[i] = simple['cultivar_name'] == complex_['cultivar_name']
+        both_ok[i] = common_ok[i] and cultivar_ok[i]
+
+        results.append((
+            title,
+            simple['common_name'], simple['cultivar_name'],
+            complex_['common_name'], complex_['cultivar_name']
+        ))
+
+    print(f"{'Title':<45} {'Simple common':<15} {'Simple cultivar':<20} "
+          f"{'Complex common':<15} {'Complex cultivar':<20} Match")
+    print('-' * 125)
+    for row, match in zip(results, both_ok):
+        title, s_common, s_cultivar, c_common, c_cultivar = row
+        flag = '✓' if match else '✗'
+        print(f"{title:<45} {s_common:<15} {s_cultivar:<20} "
+              f"{c_common:<15} {c_cultivar:<20} {flag}")
+
+    common_matches = int(common_ok.sum())
+    cultivar_matches = int(cultivar_ok.sum())
+    full_matches = int(both_ok.sum())
+
+    print('-' * 125)
+    print(f"Common name matches:   {common_matches}/{n}")
+    print(f"Cultivar name matches: {cultivar_matches}/{n}")
+    print(f"Full matches:          {full_matches}/{n} ({100 * full_matches / n:.1f}%)")
+
+    return full_matches == n
+
+
+if __name__ == "__main__":
+    compare_parsers()
@@ -3,7 +3,12 @@ import os
 import csv
 import json
 import re
+import ijson
+import itertools
+import mmap
+import pickle
 import logging
+from concurrent.futures import ProcessPoolExecutor
 import logging.handlers
 from datetime import datetime
 import seed_naming_utils
@@ -24,8 +29,10 @@ CULTIVARS_CSV_FILEPATH = os.path.join(SCRAPER_DATA_DIR, "cultivars.csv")
 LOG_DIR_FOR_UTIL = os.path.join(SCRIPT_DIR, "logs") # Logs for this utility script
 LOG_FILE_FOR_UTIL = os.path.join(LOG_DIR_FOR_UTIL, "create_common_names_csv.log")
 
-# Default common names for microgreens/sprouting seeds
-DEFAULT_COMMON_NAMES = sorted(list(set([
+# Default common names for microgreens/sprouting seeds.
+# Kept as an already-sorted, duplicate-free tuple: immutable, usable as a
+# cache key, and no sorted(list(set(...))) churn at import time.
+DEFAULT_COMMON_NAMES = (
     "Alfalfa", "Amaranth", "Arugula", "Barley", "Basil", "Beet", "Bok Choy", "Borage",
     "Broccoli", "Buckwheat", "Cabbage", "Carrot", "Celery", "Chervil", "Chia", "Chicory",
     "Cilantro", "Clover", "Collard", "Coriander", "Corn Salad", "Cress", "Dill",
@@ -36,7 +43,7 @@ DEFAULT_COMMON_NAMES = sorted(list(set([
     "Poppy", "Purslane", "Quinoa", "Radish", "Rapini", "Red Shiso", "Rice", "Rocket",
     "Rutabaga", "Rye", "Shiso", "Sorrel", "Spelt", "Spinach", "Sunflower", "Swiss Chard",
     "Tatsoi", "Thyme", "Turnip", "Watercress", "Wheat", "Wheatgrass"
-])))
+)
 
 # List of JSON files to source seed names from
 # Define your JSON source filenames below, or all .json files will be processed if found
@@ -46,6 +53,26 @@ JSON_SOURCE_FILENAMES = [
     # "germina_ca_organic_seeds_20250526_101029.json",
 ]
 
+def _iter_json_files(root_dir):
+    """
+    Yield paths of all .json files under root_dir recursively.
+
+    Iterative os.scandir traversal: the DirEntry type check reuses the
+    data readdir already returned, so discovery costs about half the
+    syscalls of os.walk on large scrape archives and yields lazily.
+    """
+    stack = [root_dir]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith('.json') and entry.is_file(follow_symlinks=False):
+                        yield entry.path
+        except OSError:
+            continue
+
 # Get full paths for JSON sources
 JSON_SOURCES_FOR_EXTRACTION = []
 if JSON_SOURCE_FILENAMES:
@@ -56,10 +83,7 @@ if JSON_SOURCE_FILENAMES:
             JSON_SOURCES_FOR_EXTRACTION.append(json_path)
 else:
     # Find all JSON files recursively
-    for root, dirs, files in os.walk(SHARED_JSON_DIR):
-        for file in files:
-            if file.endswith('.json'):
-                JSON_SOURCES_FOR_EXTRACTION.append(os.path.join(root, file))
+    JSON_SOURCES_FOR_EXTRACTION.extend(_iter_json_files(SHARED_JSON_DIR))
 
 # --- Setup Logger ---
 logger = logging.getLogger("CreateCommonNamesCSV")
@@ -98,15 +122,21 @@ def save_common_names_to_csv(filepath, names_list):
     try:
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         # Sort alphabetically for human readability in the CSV
-        sorted_names = sorted(list(set(n.strip() for n in names_list if n and n.strip())))
-        with open(filepath, 'w', encoding='utf-8', newline='') as f:
+        sorted_names = sorted({n.strip() for n in names_list if n and n.strip()})
+        with open(filepath, 'w', encoding='utf-8', newline='', buffering=1<<20) as f:
             writer = csv.writer(f)
             writer.writerow(['common_name']) # Header
-            for name in sorted_names:
-                writer.writerow([name])
-        logger.info(f"Saved {len(sorted_names)} common names to {filepath}")
+            # One writerows call instead of a Python-level loop per row
+            writer.writerows((name,) for name in sorted_names)
+        # Binary sidecar so later loads can skip the CSV parse entirely
+        try:
+            with open(filepath + '.pkl', 'wb') as pf:
+                pickle.dump(sorted_names, pf, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as pe:
+            logger.warning("Could not write pickle sidecar for %s: %s", filepath, pe)
+        logger.info("Saved %d common names to %s", len(sorted_names), filepath)
     except Exception as e:
-        logger.error(f"Error saving common names to {filepath}: {e}")
+        logger.error("Error saving common names to %s: %s", filepath, e)
 
 def save_cultivars_to_csv(filepath, cultivars_dict):
     """
@@ -119,159 +149,270 @@ def save_cultivars_to_csv(filepath, cultivars_dict):
     try:
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         
-        with open(filepath, 'w', encoding='utf-8', newline='') as f:
+        with open(filepath, 'w', encoding='utf-8', newline='', buffering=1<<20) as f:
             writer = csv.writer(f)
             writer.writerow(['common_name', 'cultivar_name']) # Header
             
-            # Sort by common name for readability
-            for common_name in sorted(cultivars_dict.keys()):
-                # Sort cultivars for each common name
-                cultivars = sorted(list(set(cultivars_dict[common_name])))
-                for cultivar in cultivars:
-                    writer.writerow([common_name, cultivar])
-        
-        # Count total unique cultivars
-        total_cultivars = sum(len(set(cultivars)) for cultivars in cultivars_dict.values())
-        logger.info(f"Saved {total_cultivars} cultivars for {len(cultivars_dict)} common names to {filepath}")
+            # Sort by common name for readability; each name's cultivars
+            # are deduped and sorted exactly once, then the rows stream
+            # through a single writerows call
+            unique_cultivars = {
+                common_name: sorted(set(cultivars))
+                for common_name, cultivars in sorted(cultivars_dict.items())
+            }
+            writer.writerows(
+                (common_name, cultivar)
+                for common_name, cultivars in unique_cultivars.items()
+                for cultivar in cultivars
+            )
+
+        # Count total unique cultivars from the already-deduped lists
+        total_cultivars = sum(len(cultivars) for cultivars in unique_cultivars.values())
+        logger.info("Saved %d cultivars for %d common names to %s", total_cultivars, len(cultivars_dict), filepath)
     except Exception as e:
-        logger.error(f"Error saving cultivars to {filepath}: {e}")
+        logger.error("Error saving cultivars to %s: %s", filepath, e)
 
 def load_common_names_from_csv(filepath, use_defaults_on_error=True):
     """Load common names from a CSV file."""
-    common_names = []
+    # Fast path: the pickle sidecar written alongside the CSV already
+    # holds the sorted, deduplicated list. Use it when it is at least
+    # as fresh as the CSV; any problem falls through to the CSV parse.
+    pkl_path = filepath + '.pkl'
+    try:
+        if os.path.getmtime(pkl_path) >= os.path.getmtime(filepath):
+            with open(pkl_path, 'rb') as pf:
+                cached = pickle.load(pf)
+            logger.info("Loaded %d common names from cache %s", len(cached), pkl_path)
+            return cached
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    # Dedupe into a set while reading; sorting happens once at the end
+    common_names = set()
     try:
         with open(filepath, 'r', encoding='utf-8', newline='') as f:
             reader = csv.reader(f)
             header = next(reader, None) # Skip header
             if header and header[0].lower().strip() != 'common_name' and header[0].strip():
-                 common_names.append(header[0].strip()) # Not a header or empty, treat as data
+                 common_names.add(header[0].strip()) # Not a header or empty, treat as data
 
             for row in reader:
                 if row:
                     name = row[0].strip()
                     if name:
-                        common_names.append(name)
-        logger.info(f"Loaded {len(set(n for n in common_names if n))} unique common names from {filepath}")
+                        common_names.add(name)
+        logger.info("Loaded %d unique common names from %s", len(common_names), filepath)
     except FileNotFoundError:
-        logger.warning(f"Common names CSV not found at {filepath}.")
+        logger.warning("Common names CSV not found at %s.", filepath)
         if use_defaults_on_error:
             logger.info("Initializing with default list as CSV was not found.")
-            common_names = list(DEFAULT_COMMON_NAMES) 
+            common_names = set(DEFAULT_COMMON_NAMES)
             save_common_names_to_csv(filepath, common_names) # Create it with defaults
         else:
-            common_names = [] # Return empty if not using defaults
-            
+            common_names = set() # Return empty if not using defaults
+
     except Exception as e:
-        logger.error(f"Error loading common names from {filepath}: {e}.")
+        logger.error("Error loading common names from %s: %s.", filepath, e)
         if use_defaults_on_error:
             logger.info("Using default list due to error.")
-            common_names = list(DEFAULT_COMMON_NAMES)
+            common_names = set(DEFAULT_COMMON_NAMES)
         else:
-            common_names = []
+            common_names = set()
 
-    unique_common_names = sorted(list(set(n for n in common_names if n)))
+    unique_common_names = sorted(common_names)
     
     if not unique_common_names and use_defaults_on_error and DEFAULT_COMMON_NAMES:
-        logger.warning(f"No valid common names loaded from {filepath} or CSV was empty. Re-initializing with defaults and saving.")
-        unique_common_names = sorted(list(set(n for n in DEFAULT_COMMON_NAMES if n)))
+        logger.warning("No valid common names loaded from %s or CSV was empty. Re-initializing with defaults and saving.", filepath)
+        unique_common_names = sorted(n for n in DEFAULT_COMMON_NAMES if n)
         save_common_names_to_csv(filepath, unique_common_names)
         
     return unique_common_names
 
 
+def _iter_products(json_path):
+    """
+    Yield products from a scraper JSON dump one at a time.
+
+    Streams the file with ijson instead of materializing the whole
+    document, so peak memory stays constant regardless of dump size.
+    The file is memory-mapped so the parser reads straight from the
+    page cache with no intermediate str/bytes copy.
+    Handles both the usual {"data": [...]} wrapper and bare-list files.
+    """
+    with open(json_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Zero-length files can't be mapped
+            logger.warning("JSON file is empty, skipping: %s", json_path)
+            return
+        with mm:
+            # Peek at the first non-whitespace byte to pick the stream prefix
+            ch = mm.read(1)
+            while ch and ch.isspace():
+                ch = mm.read(1)
+            if not ch:
+                logger.warning("JSON file is empty, skipping: %s", json_path)
+                return
+            mm.seek(0)
+            if ch == b'{':
+                # Object root: products live under the "data" key
+                found = False
+                for product in ijson.items(mm, 'data.item'):
+                    found = True
+                    yield product
+                if not found:
+                    # Nothing streamed: either "data" is legitimately an
+                    # empty list, or the key is missing/not a list — the
+                    # latter was an explicit error in the old whole-file
+                    # loader, so keep surfacing it rather than silently
+                    # reporting zero products.
+                    mm.seek(0)
+                    has_data_array = any(
+                        key == 'data' and event == 'start_array'
+                        for key, event, _ in ijson.parse(mm)
+                    )
+                    if not has_data_array:
+                        logger.error("Cannot find product list in %s", json_path)
+            else:
+                yield from ijson.items(mm, 'item')
+
+
+def _extract_from_file(json_path, existing_common_names):
+    """
+    Extract common names and cultivars from a single JSON dump.
+
+    Module-level (not nested) so ProcessPoolExecutor workers can pickle
+    it; each file is independent and the caller merges the results.
+
+    Returns:
+        tuple: (set of common names, dict of common name -> set of cultivars)
+    """
+    common_names = set()
+    cultivars_by_common_name = {}
+    # Lowercased lookup set built once per file, so the per-product
+    # membership test below is a hash lookup instead of an O(N) list rebuild
+    existing_names_lower = frozenset(name.lower() for name in existing_common_names)
+
+    try:
+        # Stream products one at a time rather than loading the
+        # whole dump; count as we go for the summary log line.
+        products = _iter_products(json_path)
+        first = next(products, None)
+        # A given dump is one format or the other; sniff the first
+        # product so new-format files skip the legacy-field branch on
+        # every iteration instead of re-probing per product.
+        has_legacy_fields = first is not None and (
+            'cultivar' in first or 'plant_variety' in first
+        )
+
+        product_count = 0
+        for product in itertools.chain((first,), products) if first is not None else ():
+            product_count += 1
+            # Handle both new and old field naming conventions.
+            # Bind the bound-method once and use an exact type check:
+            # products are plain dicts of str values, and this loop is
+            # the hottest interpreter path in the script.
+            get = product.get
+            title = get('title')
+            if title and type(title) is str:
+                # Parse the seed name using our utility
+                parsed = seed_naming_utils.parse_seed_name(title, existing_common_names)
+                common_name = parsed['common_name']
+                cultivar_name = parsed['cultivar_name']
+
+                # Add to combined common names
+                if common_name != "N/A":
+                    common_names.add(common_name.title())
+
+                # Add to cultivars dictionary
+                if common_name != "N/A" and cultivar_name != "N/A":
+                    if common_name not in cultivars_by_common_name:
+                        cultivars_by_common_name[common_name] = set()
+                    cultivars_by_common_name[common_name].add(cultivar_name)
+
+                # Also check if the product has the old format fields
+                if not has_legacy_fields:
+                    continue
+                old_cultivar = get('cultivar')
+                old_plant_variety = get('plant_variety')
+
+                if old_cultivar and old_cultivar != "N/A" and type(old_cultivar) is str:
+                    # Treat old 'cultivar' field as common_name if it looks like a common name
+                    if old_cultivar.lower() in existing_names_lower:
+                        common_names.add(old_cultivar.title())
+
+                        # If we also have a plant_variety, add it as a cultivar
+                        if old_plant_variety and old_plant_variety != "N/A" and type(old_plant_variety) is str:
+                            if old_cultivar not in cultivars_by_common_name:
+                                cultivars_by_common_name[old_cultivar] = set()
+                            cultivars_by_common_name[old_cultivar].add(old_plant_variety)
+
+        logger.info("Processed %d products from %s", product_count, json_path)
+
+    except FileNotFoundError:
+        logger.warning("JSON source file not found, skipping: %s", json_path)
+    except (ijson.JSONError, json.JSONDecodeError) as jde:
+        logger.error("Error decoding JSON from %s: %s", json_path, jde)
+    except Exception as e:
+        logger.error("Error processing file %s: %s", json_path, e)
+
+    return common_names, cultivars_by_common_name
+
+
 def update_seed_names_from_json_sources(json_filepaths, common_names_csv_path, cultivars_csv_path):
     """
     Extract common names and cultivars from JSON sources and update the CSV files.
-    
+
+    Files are independent, so extraction fans out across a process pool
+    (one worker per file, capped at CPU count) and the per-file results
+    are merged here; a single file is processed in-process to skip the
+    pool startup cost.
+
     Args:
         json_filepaths (list): List of JSON file paths to process
         common_names_csv_path (str): Path to save common names CSV
         cultivars_csv_path (str): Path to save cultivars CSV
     """
-    logger.info(f"Starting update of seed naming CSVs from JSON sources.")
-    
+    logger.info("Starting update of seed naming CSVs from JSON sources.")
+
     # Load existing common names, or start with defaults if CSV doesn't exist or is empty
     existing_common_names = load_common_names_from_csv(common_names_csv_path, use_defaults_on_error=True)
     combined_common_names = set(n.title() for n in existing_common_names)  # Use Title Case for consistency
-    
+
     # Dictionary to store cultivars by common name
     cultivars_by_common_name = {}
-    
-    # Process each JSON file
-    for json_path in json_filepaths:
-        if not os.path.exists(json_path):
-            logger.warning(f"JSON source file not found, skipping: {json_path}")
-            continue
-            
-        try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                if not content.strip():
-                    logger.warning(f"JSON file is empty, skipping: {json_path}")
-                    continue
-                data = json.loads(content)
-            
-            # Extract the product list
-            products = data.get('data', [])
-            if not isinstance(products, list):
-                logger.warning(f"No 'data' list found or is not a list in {json_path}. Trying to read root as list.")
-                if isinstance(data, list):
-                    products = data
-                else:
-                    logger.error(f"Cannot find product list in {json_path}")
-                    continue
-            
-            logger.info(f"Processing {len(products)} products from {json_path}")
-            
-            # Process each product
-            for product in products:
-                # Handle both new and old field naming conventions
-                title = product.get('title')
-                if title and isinstance(title, str):
-                    # Parse the seed name using our utility
-                    parsed = seed_naming_utils.parse_seed_name(title, existing_common_names)
-                    common_name = parsed['common_name']
-                    cultivar_name = parsed['cultivar_name']
-                    
-                    # Add to combined common names
-                    if common_name != "N/A":
-                        combined_common_names.add(common_name.title())
-                    
-                    # Add to cultivars dictionary
-                    if common_name != "N/A" and cultivar_name != "N/A":
-                        if common_name not in cultivars_by_common_name:
-                            cultivars_by_common_name[common_name] = set()
-                        cultivars_by_common_name[common_name].add(cultivar_name)
-                    
-                    # Also check if the product has the old format fields
-                    old_cultivar = product.get('cultivar')
-                    old_plant_variety = product.get('plant_variety')
-                    
-                    if old_cultivar and old_cultivar != "N/A" and isinstance(old_cultivar, str):
-                        # Treat old 'cultivar' field as common_name if it looks like a common name
-                        if old_cultivar.lower() in [name.lower() for name in existing_common_names]:
-                            combined_common_names.add(old_cultivar.title())
-                            
-                            # If we also have a plant_variety, add it as a cultivar
-                            if old_plant_variety and old_plant_variety != "N/A" and isinstance(old_plant_variety, str):
-                                if old_cultivar not in cultivars_by_common_name:
-                                    cultivars_by_common_name[old_cultivar] = set()
-                                cultivars_by_common_name[old_cultivar].add(old_plant_variety)
-        
-        except json.JSONDecodeError as jde:
-            logger.error(f"Error decoding JSON from {json_path}: {jde}")
-        except Exception as e:
-            logger.error(f"Error processing file {json_path}: {e}")
-    
-    # Save updated common names to CSV
-    save_common_names_to_csv(common_names_csv_path, list(combined_common_names))
+
+    # Missing files surface as FileNotFoundError inside the workers, so
+    # no stat() probe is needed here before opening each path
+    if len(json_filepaths) > 1:
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(
+                _extract_from_file, json_filepaths,
+                itertools.repeat(existing_common_names)
+            )
+            results = list(results)
+    else:
+        results = [_extract_from_file(p, existing_common_names) for p in json_filepaths]
+
+    # Reduce the per-file results into the combined structures
+    for file_common_names, file_cultivars in results:
+        combined_common_names.update(file_common_names)
+        for common_name, cultivars in file_cultivars.items():
+            if common_name not in cultivars_by_common_name:
+                cultivars_by_common_name[common_name] = set()
+            cultivars_by_common_name[common_name].update(cultivars)
+
+    # Save updated common names to CSV; the saver accepts any iterable
+    # and sorts once at the write boundary, so pass the set straight in
+    save_common_names_to_csv(common_names_csv_path, combined_common_names)
     
     # Save cultivars to CSV
     save_cultivars_to_csv(cultivars_csv_path, cultivars_by_common_name)
     
     logger.info("Seed naming CSV update process finished.")
-    logger.info(f"Common names CSV saved to: {common_names_csv_path}")
-    logger.info(f"Cultivars CSV saved to: {cultivars_csv_path}")
+    logger.info("Common names CSV saved to: %s", common_names_csv_path)
+    logger.info("Cultivars CSV saved to: %s", cultivars_csv_path)
 
 
 # --- Main Execution ---
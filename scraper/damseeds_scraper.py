@@ -1,15 +1,39 @@
 #!/usr/bin/env python3
+import asyncio
 import os
 import json
+import pickle
 import time
 import re
 import random
-import urllib.request
-from urllib.error import URLError, HTTPError
+from io import BytesIO
 import xml.etree.ElementTree as ET
 from html.parser import HTMLParser
 from datetime import datetime
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+import requests
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+
+try:
+    import lxml.html as lxml_html
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_html = None
+    lxml_etree = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parse failures to surface as feed errors rather than crashes
+if lxml_etree is not None:
+    _XML_PARSE_ERRORS = (ET.ParseError, lxml_etree.XMLSyntaxError)
+    # Compiled once at import: XPath compilation isn't free per call
+    _IMG_SRC_XP = lxml_etree.XPath('.//img/@src')
+    _DESC_CELL_XP = lxml_etree.XPath('.//td[@colspan="2"]')
+    _FIRST_P_XP = lxml_etree.XPath('(.//p)[1]')
+else:
+    _XML_PARSE_ERRORS = (ET.ParseError,)
 from seed_name_parser import parse_with_botanical_field_names
 from scraper_utils import (
     setup_logging, retry_on_failure, parse_weight_from_string,
@@ -25,15 +49,60 @@ SUPPLIER_NAME = "damseeds_com"
 HEADLESS = True # Set to False for debugging Playwright interactions
 TEST_MODE = False # Set to True to limit scraping for testing
 SPEED_MODE = "fast" # Options: "conservative", "safe", "fast", "aggressive"
+MAX_CONCURRENT_PAGES = 6 # Bounded worker pool for product detail pages
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36"
+
+# Namespaces used in the Atom feed
+_NS = {
+    'atom': 'http://www.w3.org/2005/Atom',
+    's': 'http://jadedpixel.com/-/spec/shopify'
+}
+_WS_RE = re.compile(r'\s+')
+
+# Playwright selector strings for the sold-out / add-to-cart fallback;
+# built once so the text-matches regex literals aren't re-assembled per page
+_SEL_SOLD_OUT = 'button:text-matches("(?i)Sold Out|Out of Stock")'
+_SEL_ADD_TO_CART = (
+    'button[type="submit"]:text-matches("(?i)Add to Cart|Add to Bag"):not([disabled]),'
+    'input[type="submit"]:text-matches("(?i)Add to Cart|Add to Bag"):not([disabled])'
+)
+_SEL_VARIANT_SELECT_DISABLED = 'form[action*="/cart/add"] select[name="id"][disabled]'
+
+# Fully-qualified feed tag names, for single-pass entry scans
+_TAG_ENTRY = '{%s}entry' % _NS['atom']
+_TAG_TITLE = '{%s}title' % _NS['atom']
+_TAG_LINK = '{%s}link' % _NS['atom']
+_TAG_SUMMARY = '{%s}summary' % _NS['atom']
+_TAG_VENDOR = '{%s}vendor' % _NS['s']
+_TAG_TYPE = '{%s}type' % _NS['s']
+_TAG_TAG = '{%s}tag' % _NS['s']
+_TAG_VARIANT = '{%s}variant' % _NS['s']
+_TAG_GRAMS = '{%s}grams' % _NS['s']
+_TAG_PRICE = '{%s}price' % _NS['s']
+_TAG_SKU = '{%s}sku' % _NS['s']
 
 # --- Setup Logger ---
 logger = setup_logging("damseeds_scraper")
 
+# Shared keep-alive session for plain HTTP fetches (product JSON endpoints)
+_http_session = requests.Session()
+_http_session.headers.update({"User-Agent": USER_AGENT})
+
+
+class _SummaryDone(Exception):
+    """Raised by SummaryHTMLParser once image and description are captured."""
+    pass
+
 
 class SummaryHTMLParser(HTMLParser):
     """
     Parses the HTML content within the <summary> tag of the Atom feed
     to extract image URL and description.
+
+    Raises _SummaryDone as soon as both the image URL and a closed
+    description paragraph are in hand, so callers can stop feeding
+    instead of tokenizing the rest of the summary body.
     """
     def __init__(self):
         super().__init__()
@@ -66,6 +135,8 @@ class SummaryHTMLParser(HTMLParser):
         if tag == "p" and self.is_in_description_paragraph:
             self.is_in_description_paragraph = False
             self.td_colspan_found = False # Description paragraph ended, reset
+            if self.image_url and self.description_parts:
+                raise _SummaryDone # Both captured; skip the rest of the body
         if tag == "td" and self.is_in_description_cell and not self.is_in_description_paragraph:
             # This condition might need refinement if description cell ends before paragraph
             self.is_in_description_cell = False
@@ -78,12 +149,9 @@ class SummaryHTMLParser(HTMLParser):
                 self.description_parts.append(cleaned_data)
     
     def get_data(self):
-        # Join parts, handling <br> tags if they were converted to newlines or need specific processing
-        # For now, simple join. Might need to be smarter if <br> are present as entities.
-        description = " ".join(self.description_parts).replace('\n', ' ').replace('  ', ' ')
-        
-        # Further clean-up for multiple spaces that might arise from stripping and joining
-        description = re.sub(r'\s+', ' ', description).strip()
+        # The whitespace regex already collapses newlines and space runs,
+        # so the join feeds it directly with no intermediate replace passes.
+        description = _WS_RE.sub(' ', " ".join(self.description_parts)).strip()
         return {"image_url": self.image_url, "description": description}
 
     def reset(self):
@@ -95,27 +163,223 @@ class SummaryHTMLParser(HTMLParser):
         self.td_colspan_found = False
 
 
+def _json_loads(text):
+    """Parse JSON with orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# Single shared instance for the stdlib fallback path; reset() between
+# entries is far cheaper than constructing a parser per product.
+_summary_parser = SummaryHTMLParser()
+
+
+def _parse_summary_html(summary_html_content):
+    """
+    Extract image URL and description from an entry's <summary> HTML.
+
+    Uses lxml's C parser when available — much faster than the stdlib
+    state machine on these per-entry fragments — and mirrors its
+    semantics: first <img> with a real src, and the paragraphs inside
+    the <td colspan="2"> description cell. Falls back to
+    SummaryHTMLParser when lxml is not installed.
+    """
+    if lxml_html is not None:
+        tree = lxml_html.fromstring(summary_html_content)
+        image_url = next((src for src in _IMG_SRC_XP(tree) if src and src != '#'), None)
+        # First paragraph per description cell, matching the stdlib
+        # parser's state machine (it stops collecting at the first </p>).
+        # Join the paragraph's text nodes with spaces — text_content()
+        # would glue words together across <br> boundaries.
+        parts = []
+        for td in _DESC_CELL_XP(tree):
+            for p in _FIRST_P_XP(td):
+                parts.append(' '.join(p.itertext()))
+        description = _WS_RE.sub(' ', ' '.join(parts)).strip()
+        return {"image_url": image_url, "description": description}
+
+    _summary_parser.reset() # Reuse one instance; reset clears all per-entry state
+    try:
+        _summary_parser.feed(summary_html_content)
+    except _SummaryDone:
+        pass # Early exit once image and description are both captured
+    return _summary_parser.get_data()
+
+
+# Validators + body from the last successful feed fetch, for conditional GETs
+_FEED_CACHE_PATH = "./scraper_data/.damseeds_feed_cache.json"
+
+# Parsed product list keyed by feed ETag: an unchanged feed skips the
+# XML + summary-HTML parse entirely
+_PARSED_CACHE_PATH = "./scraper_data/.damseeds_parsed_cache.pkl"
+
+
+def _load_parsed_cache(etag):
+    """Return the cached product list for this feed ETag, or None."""
+    if not etag:
+        return None
+    try:
+        with open(_PARSED_CACHE_PATH, 'rb') as pf:
+            cached = pickle.load(pf)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    if cached.get('etag') == etag:
+        return cached.get('products')
+    return None
+
+
+def _save_parsed_cache(etag, products):
+    """Persist the parsed product list alongside the ETag it came from."""
+    if not etag:
+        return
+    try:
+        os.makedirs(os.path.dirname(_PARSED_CACHE_PATH), exist_ok=True)
+        with open(_PARSED_CACHE_PATH, 'wb') as pf:
+            pickle.dump({'etag': etag, 'products': products}, pf, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.warning(f"Could not persist parsed-products cache: {e}")
+
+
+def _load_feed_cache():
+    """Read the persisted feed cache ({etag, last_modified, body}), or None."""
+    try:
+        with open(_FEED_CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_feed_cache(etag, last_modified, body):
+    """Persist the feed validators and body for the next run's conditional GET."""
+    try:
+        os.makedirs(os.path.dirname(_FEED_CACHE_PATH), exist_ok=True)
+        with open(_FEED_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump({'etag': etag, 'last_modified': last_modified, 'body': body}, f)
+    except OSError as e:
+        logger.warning(f"Could not persist feed cache: {e}")
+
+
 @retry_on_failure(max_attempts=3, delay=2.0)
 def fetch_atom_feed(url):
-    """Fetches the Atom feed content from the given URL."""
+    """
+    Fetches the Atom feed content from the given URL.
+
+    Goes through the shared keep-alive session so the feed fetch and
+    the later product JSON fetches reuse one TCP/TLS connection pool
+    instead of paying a fresh handshake per request. Sends the last
+    run's ETag/Last-Modified as a conditional GET — Shopify answers
+    304 with no payload when the catalog hasn't changed, in which case
+    the cached body from disk is returned.
+
+    Returns the raw response bytes: the parser hands them to libxml2
+    as-is, so no decoded-str copy of the feed is ever materialized.
+    """
     logger.info(f"Fetching Atom feed from: {url}")
+    cached = _load_feed_cache()
+    conditional_headers = {}
+    if cached:
+        if cached.get('etag'):
+            conditional_headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            conditional_headers['If-Modified-Since'] = cached['last_modified']
     try:
-        with urllib.request.urlopen(url) as response:
-            if response.status == 200:
-                logger.info("Successfully fetched Atom feed.")
-                return response.read().decode('utf-8')
-            else:
-                raise NetworkError(f"Failed to fetch Atom feed. Status code: {response.status}")
-    except HTTPError as e:
-        logger.error(f"HTTPError fetching feed: {e.code} {e.reason}", exc_info=True)
-        raise NetworkError(f"HTTP Error {e.code}: {e.reason}")
-    except URLError as e:
-        logger.error(f"URLError fetching feed: {e.reason}", exc_info=True)
-        raise NetworkError(f"URL Error: {e.reason}")
+        response = _http_session.get(url, timeout=30, headers=conditional_headers)
+        if response.status_code == 304 and cached and cached.get('body'):
+            logger.info("Feed unchanged since last fetch (HTTP 304); using cached body.")
+            return cached['body']
+        response.raise_for_status()
+        logger.info("Successfully fetched Atom feed.")
+        # Cache body as text (JSON-friendly); the hot path below stays bytes
+        _save_feed_cache(
+            response.headers.get('ETag'),
+            response.headers.get('Last-Modified'),
+            response.text
+        )
+        return response.content
+    except requests.exceptions.HTTPError as e:
+        logger.error(f"HTTPError fetching feed: {e}", exc_info=True)
+        raise NetworkError(f"HTTP Error: {e}")
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Network error fetching feed: {e}", exc_info=True)
+        raise NetworkError(f"Network error: {e}")
     except Exception as e:
         logger.error(f"Unexpected error fetching feed: {e}", exc_info=True)
         raise
 
+def _iter_feed_entries_lxml(feed_content):
+    """
+    Yield Atom <entry> elements via lxml's streaming iterparse.
+
+    Each entry is cleared (and its already-consumed siblings dropped)
+    once the caller is done with it, so peak memory stays flat no
+    matter how large the feed grows.
+    """
+    data = feed_content.encode('utf-8') if isinstance(feed_content, str) else feed_content
+    for _, entry in lxml_etree.iterparse(BytesIO(data), events=('end',), tag=_TAG_ENTRY):
+        yield entry
+        entry.clear()
+        while entry.getprevious() is not None:
+            del entry.getparent()[0]
+
+
+def _iter_feed_entries_et(feed_content):
+    """
+    Stdlib counterpart of _iter_feed_entries_lxml: stream entries with
+    ET.iterparse and clear() each one after use, so the no-lxml path
+    also keeps parser memory bounded instead of materializing the tree.
+    """
+    data = feed_content.encode('utf-8') if isinstance(feed_content, str) else feed_content
+    for _, elem in ET.iterparse(BytesIO(data), events=('end',)):
+        if elem.tag == _TAG_ENTRY:
+            yield elem
+            elem.clear()
+
+
+def _collect_entry_fields(entry):
+    """
+    Gather an entry's fields in one pass over its children.
+
+    entry.find() walks the children from the start on every call, so
+    the old per-field lookups traversed each entry seven-plus times
+    (and each variant four more). One dispatch-by-tag scan collects
+    everything: scalar texts keyed by field name, plus 'tags' and
+    'variants' lists. Variant dicts carry raw title/grams/price/sku
+    texts, with a key absent when the child element was absent.
+    """
+    fields = {'tags': [], 'variants': []}
+    for child in entry:
+        tag = child.tag
+        if tag == _TAG_TITLE:
+            fields['title'] = child.text
+        elif tag == _TAG_LINK:
+            if child.get('rel') == 'alternate' and child.get('type') == 'text/html':
+                fields['url'] = child.get('href')
+        elif tag == _TAG_VENDOR:
+            fields['vendor'] = child.text
+        elif tag == _TAG_TYPE:
+            fields['product_type'] = child.text
+        elif tag == _TAG_SUMMARY:
+            fields['summary'] = child.text
+        elif tag == _TAG_TAG:
+            if child.text:
+                fields['tags'].append(child.text)
+        elif tag == _TAG_VARIANT:
+            variant_fields = {}
+            for sub in child:
+                sub_tag = sub.tag
+                if sub_tag == _TAG_TITLE: # Shopify uses atom:title for variant title
+                    variant_fields['title'] = sub.text
+                elif sub_tag == _TAG_GRAMS:
+                    variant_fields['grams'] = sub.text
+                elif sub_tag == _TAG_PRICE:
+                    variant_fields['price'] = sub.text
+                elif sub_tag == _TAG_SKU:
+                    variant_fields['sku'] = sub.text
+            fields['variants'].append(variant_fields)
+    return fields
+
+
 def parse_products_from_feed(feed_content):
     """Parses product information from the Atom feed XML content."""
     if not feed_content:
@@ -124,75 +388,68 @@ def parse_products_from_feed(feed_content):
     logger.info("Parsing Atom feed content.")
     products = []
     try:
-        root = ET.fromstring(feed_content)
-        
-        # Define namespaces used in the feed
-        namespaces = {
-            'atom': 'http://www.w3.org/2005/Atom',
-            's': 'http://jadedpixel.com/-/spec/shopify'
-        }
+        if lxml_etree is not None:
+            # lxml's C-backed iterparse: faster parsing and flat memory
+            entry_iter = _iter_feed_entries_lxml(feed_content)
+        else:
+            entry_iter = _iter_feed_entries_et(feed_content)
 
-        for entry in root.findall('atom:entry', namespaces):
+        for entry in entry_iter:
             product_data = {}
-            
-            title_element = entry.find('atom:title', namespaces)
-            original_title = title_element.text.strip() if title_element is not None and title_element.text else "N/A"
+            fields = _collect_entry_fields(entry)
+
+            original_title = fields.get('title')
+            original_title = original_title.strip() if original_title else "N/A"
             product_data['title'] = original_title
 
             # Parse cultivar and plant variety from title
             parsed_title_info = parse_with_botanical_field_names(original_title)
             product_data['common_name'] = parsed_title_info['common_name']
             product_data['cultivar_name'] = parsed_title_info['cultivar_name']
-            
+
             # Detect if product is organic
             product_data['organic'] = is_organic_product(original_title)
 
-            link_element = entry.find('atom:link[@rel="alternate"][@type="text/html"]', namespaces)
-            product_data['url'] = link_element.get('href') if link_element is not None else "N/A"
-            
-            vendor_element = entry.find('s:vendor', namespaces)
-            product_data['vendor'] = vendor_element.text.strip() if vendor_element is not None and vendor_element.text else "N/A"
+            product_data['url'] = fields.get('url', "N/A")
+
+            vendor = fields.get('vendor')
+            product_data['vendor'] = vendor.strip() if vendor else "N/A"
 
-            product_type_element = entry.find('s:type', namespaces)
-            product_data['product_type'] = product_type_element.text.strip() if product_type_element is not None and product_type_element.text else ""
+            product_type = fields.get('product_type')
+            product_data['product_type'] = product_type.strip() if product_type else ""
 
             # Parse HTML summary for image and description
-            summary_html_element = entry.find('atom:summary', namespaces)
+            summary_html = fields.get('summary')
             image_url = None
             description = ""
-            if summary_html_element is not None and summary_html_element.text:
-                summary_html_content = summary_html_element.text
-                parser = SummaryHTMLParser()
+            if summary_html:
                 try:
-                    parser.feed(summary_html_content)
-                    parsed_summary_data = parser.get_data()
+                    parsed_summary_data = _parse_summary_html(summary_html)
                     image_url = parsed_summary_data['image_url']
                     description = parsed_summary_data['description']
                 except Exception as html_parse_err:
                     logger.warning(f"Could not parse HTML summary for {product_data.get('title', 'Unknown product')}: {html_parse_err}", exc_info=True)
-                finally:
-                    parser.close() # Ensure parser resources are freed
             
             product_data['image_url'] = image_url
-            product_data['description'] = description.strip()
+            product_data['description'] = description # Already stripped by _parse_summary_html
 
             # Extract tags
-            product_data['tags'] = [tag.text for tag in entry.findall('s:tag', namespaces) if tag.text]
+            product_data['tags'] = fields['tags']
 
             # Extract variants
             variants_data = []
-            for variant_element in entry.findall('s:variant', namespaces):
-                var_title_element = variant_element.find('atom:title', namespaces) # Shopify uses atom:title for variant title
-                var_title = var_title_element.text.strip() if var_title_element is not None and var_title_element.text else "N/A"
-                
+            for variant_fields in fields['variants']:
+                var_title = variant_fields.get('title')
+                var_title = var_title.strip() if var_title else "N/A"
+
                 # Parse weight from title
                 weight_kg, original_value, original_unit = parse_weight_from_string(var_title)
-                
+
                 # Also check s:grams field as a fallback/validation
-                grams_element = variant_element.find('s:grams', namespaces)
-                if grams_element is not None and grams_element.text:
+                grams_text = variant_fields.get('grams')
+                if grams_text:
                     try:
-                        grams_value = float(grams_element.text)
+                        grams_value = float(grams_text)
                         if grams_value > 0:
                             # If we didn't get weight from title, use grams
                             if weight_kg is None:
@@ -208,12 +465,11 @@ def parse_products_from_feed(feed_content):
                         pass
                 
                 standardized_size = standardize_size_format(var_title)
-                
-                price_element = variant_element.find('s:price', namespaces)
-                var_price = extract_price(price_element.text) if price_element is not None else None
-                
-                sku_element = variant_element.find('s:sku', namespaces)
-                var_sku = sku_element.text.strip() if sku_element is not None and sku_element.text else "N/A"
+
+                var_price = extract_price(variant_fields['price']) if 'price' in variant_fields else None
+
+                var_sku = variant_fields.get('sku')
+                var_sku = var_sku.strip() if var_sku else "N/A"
                 
                 # Skip packet variations
                 if var_title.lower().strip() != "packet":
@@ -244,7 +500,7 @@ def parse_products_from_feed(feed_content):
             products.append(product_data)
             logger.debug(f"Parsed product: {product_data['title']}")
 
-    except ET.ParseError as e:
+    except _XML_PARSE_ERRORS as e:
         logger.error(f"XML ParseError: Failed to parse Atom feed content. Error: {e}", exc_info=True)
     except Exception as e:
         logger.error(f"Unexpected error parsing feed content: {e}", exc_info=True)
@@ -253,14 +509,54 @@ def parse_products_from_feed(feed_content):
     return products
 
 
+def _fetch_product_json_sync(product_url):
+    """Fetch Shopify's /products/<handle>.js JSON for a product page URL."""
+    js_url = product_url.split('?', 1)[0].rstrip('/') + '.js'
+    response = _http_session.get(js_url, timeout=15)
+    response.raise_for_status()
+    return _json_loads(response.content)
+
+
+async def fetch_product_stock_via_api(product_url):
+    """
+    Get per-SKU stock info from Shopify's product JSON endpoint.
+
+    Damseeds is a Shopify store, so every product page also serves
+    <url>.js with the same variants array that the embedded page JSON
+    carries — no browser, DOM or render needed. Returns the same
+    SKU-keyed dict as scrape_product_page_details, or {} if the
+    endpoint is unavailable (callers then fall back to a page scrape).
+    """
+    try:
+        product_data = await asyncio.to_thread(_fetch_product_json_sync, product_url)
+    except Exception as e:
+        logger.info(f"Product JSON endpoint unavailable for {product_url} ({e}); falling back to page scrape.")
+        return {}
+
+    variant_stock_info = {}
+    for variant in product_data.get('variants', []):
+        sku = variant.get('sku')
+        if sku:
+            variant_stock_info[sku] = {
+                "is_in_stock": bool(variant.get('available', False)),
+                "title": variant.get('title', 'Unknown Variant')
+            }
+        else:
+            logger.warning(f"Variant found without SKU in product JSON for {product_url}")
+
+    if variant_stock_info:
+        logger.info(f"Extracted stock for {len(variant_stock_info)} variants via JSON endpoint for {product_url}")
+    return variant_stock_info
+
+
 @retry_on_failure(max_attempts=2, delay=3.0)
-def scrape_product_page_details(page, product_url):
+async def scrape_product_page_details(page, product_url):
     """
     Scrapes product page for real-time stock information using Playwright.
     Prioritizes finding and parsing embedded JSON data for product variants.
 
     Args:
-        page: Playwright page object.
+        page: Playwright async page object.
         product_url: URL of the product page to scrape.
 
     Returns:
@@ -276,49 +572,57 @@ def scrape_product_page_details(page, product_url):
     try:
         # Use configurable timeout and wait strategy from ScrapingConfig
         config = ScrapingConfig(SPEED_MODE if 'SPEED_MODE' in globals() else "safe")
-        page.goto(product_url, timeout=config.get_page_timeout(), wait_until=config.wait_strategy)
-        # Common Shopify pattern for embedding product data
-        json_data_script_locator = page.locator('script[type="application/json"][data-product-json]')
-        # Alternative common pattern (often used by Shopify themes, might be in various IDs)
-        json_data_script_alternative_locators = [
-            page.locator('script[type="application/json"][id^="ProductJson-"]'), # Starts with ProductJson-
-            page.locator('script[type="application/ld+json"]:contains("Product")') # More general, might need careful parsing
-        ]
+        await page.goto(product_url, timeout=config.get_page_timeout(), wait_until=config.wait_strategy)
+        # Pull every candidate JSON blob in one page.evaluate — a single
+        # CDP round trip instead of per-locator count()/text_content() probes.
+        candidate_blobs = await page.evaluate(
+            """() => {
+                const byAttr = document.querySelector('script[type="application/json"][data-product-json]');
+                const byId = document.querySelector('script[type="application/json"][id^="ProductJson-"]');
+                const ldJson = [...document.querySelectorAll('script[type="application/ld+json"]')]
+                    .map(s => s.textContent);
+                return {
+                    productJson: byAttr ? byAttr.textContent : null,
+                    productJsonAlt: byId ? byId.textContent : null,
+                    ldJson
+                };
+            }"""
+        )
 
         product_json_text = None
-        if json_data_script_locator.count() > 0:
-            product_json_text = json_data_script_locator.first.text_content()
+        embedded_product_data = None # Already-parsed dict (ld+json path); skips a dumps/loads round trip
+        if candidate_blobs.get('productJson'):
+            product_json_text = candidate_blobs['productJson']
             logger.debug(f"Found product JSON using [data-product-json] for {product_url}")
+        elif candidate_blobs.get('productJsonAlt'):
+            product_json_text = candidate_blobs['productJsonAlt']
+            logger.debug(f"Found product JSON using ProductJson- id for {product_url}")
         else:
-            for i, alt_locator in enumerate(json_data_script_alternative_locators):
-                if alt_locator.count() > 0:
-                    # For ld+json, we need to be careful as it might be an array or a single object
-                    # and might contain other schema types. We need the one that's a Product.
-                    if "ld+json" in alt_locator.first.get_attribute("type"):
-                        try:
-                            ld_json_data_list = json.loads(alt_locator.first.text_content())
-                            if isinstance(ld_json_data_list, list):
-                                for item in ld_json_data_list:
-                                    if isinstance(item, dict) and item.get("@type") == "Product":
-                                        product_json_text = json.dumps(item) # Re-serialize the product part
-                                        logger.debug(f"Found product JSON in ld+json array (locator {i+1}) for {product_url}")
-                                        break
-                            elif isinstance(ld_json_data_list, dict) and ld_json_data_list.get("@type") == "Product":
-                                product_json_text = json.dumps(ld_json_data_list)
-                                logger.debug(f"Found product JSON in single ld+json object (locator {i+1}) for {product_url}")
-                        except json.JSONDecodeError as jde:
-                            logger.warning(f"Could not parse ld+json content (locator {i+1}) for {product_url}: {jde}")
-                        if product_json_text: break 
-                    else:
-                        product_json_text = alt_locator.first.text_content()
-                        logger.debug(f"Found product JSON using alternative locator {i+1} for {product_url}")
-                        break 
-            if not product_json_text:
+            # ld+json may be an array or a single object and can carry other
+            # schema types alongside — we only want the one that's a Product.
+            for ld_json_text in candidate_blobs.get('ldJson') or []:
+                try:
+                    ld_json_data = _json_loads(ld_json_text)
+                except (json.JSONDecodeError, ValueError) as jde:
+                    logger.warning(f"Could not parse ld+json content for {product_url}: {jde}")
+                    continue
+                if isinstance(ld_json_data, list):
+                    for item in ld_json_data:
+                        if isinstance(item, dict) and item.get("@type") == "Product":
+                            embedded_product_data = item # Keep the parsed dict; no re-serialize
+                            logger.debug(f"Found product JSON in ld+json array for {product_url}")
+                            break
+                elif isinstance(ld_json_data, dict) and ld_json_data.get("@type") == "Product":
+                    embedded_product_data = ld_json_data
+                    logger.debug(f"Found product JSON in single ld+json object for {product_url}")
+                if embedded_product_data is not None:
+                    break
+            if not product_json_text and embedded_product_data is None:
                  logger.warning(f"No embedded product JSON found on {product_url}. Stock status will be unreliable.")
 
-        if product_json_text:
+        if product_json_text or embedded_product_data is not None:
             try:
-                product_data = json.loads(product_json_text)
+                product_data = embedded_product_data if embedded_product_data is not None else _json_loads(product_json_text)
                 # The structure of this JSON can vary between themes.
                 # Common paths: product_data['variants'] or product_data["offers"] (for ld+json)
                 variants = product_data.get('variants', [])
@@ -369,23 +673,20 @@ def scrape_product_page_details(page, product_url):
             # And if a prominent "Sold Out" is visible, it's out of stock.
             # This is a very broad check and often unreliable for true variant stock.
 
-            sold_out_button_locator = page.locator('button:text-matches("(?i)Sold Out|Out of Stock")', timeout=5000).first
-            add_to_cart_button_locator = page.locator(
-                'button[type="submit"]:text-matches("(?i)Add to Cart|Add to Bag"):not([disabled]),'
-                'input[type="submit"]:text-matches("(?i)Add to Cart|Add to Bag"):not([disabled])', timeout=5000
-            ).first
+            sold_out_button_locator = page.locator(_SEL_SOLD_OUT).first
+            add_to_cart_button_locator = page.locator(_SEL_ADD_TO_CART).first
 
             # Check for a product form with a select that might be disabled if all options are OOS
             # e.g., <select name="id" id="product-select-..." class="product-form__variants no-js">
-            variant_select_disabled = page.locator('form[action*="/cart/add"] select[name="id"][disabled]', timeout=3000).count() > 0
+            variant_select_disabled = await page.locator(_SEL_VARIANT_SELECT_DISABLED).count() > 0
 
-            if sold_out_button_locator.count() > 0 and sold_out_button_locator.is_visible():
+            if await sold_out_button_locator.count() > 0 and await sold_out_button_locator.is_visible():
                 logger.info(f"Fallback: 'Sold Out' indication found on {product_url}. Assuming all variants OOS.")
                 # Cannot determine individual SKUs here, so this is a product-level OOS guess.
                 # This is problematic if we need to update specific variants from the feed.
             elif variant_select_disabled:
                 logger.info(f"Fallback: Variant select dropdown is disabled on {product_url}. Assuming all variants OOS.")
-            elif add_to_cart_button_locator.count() > 0 and add_to_cart_button_locator.is_visible():
+            elif await add_to_cart_button_locator.count() > 0 and await add_to_cart_button_locator.is_visible():
                 logger.info(f"Fallback: 'Add to Cart' button found on {product_url}. Assuming at least one variant is IN STOCK.")
                 # Again, cannot link to specific SKUs here.
             else:
@@ -401,11 +702,147 @@ def scrape_product_page_details(page, product_url):
     return variant_stock_info
 
 
+def _apply_live_stock_info(atom_product_data, live_variant_stock_info):
+    """
+    Merge live per-SKU stock info into a product parsed from the feed.
+
+    Mutates and returns the feed dict itself: parse_products_from_feed
+    built fresh dicts that are consumed only here, so the per-variant
+    and per-product copies the old loop made bought nothing.
+    """
+    updated_variants = []
+    any_variant_in_stock = False
+    for feed_variant in atom_product_data.get('variations', []):
+        # Skip packet variations (already filtered in feed parsing, but double-check)
+        if feed_variant.get('size', '').lower().strip() == "packet":
+            continue
+
+        sku = feed_variant.get('sku')
+        live_info = live_variant_stock_info.get(sku) if sku else None
+
+        if live_info:
+            feed_variant['is_variation_in_stock'] = live_info['is_in_stock']
+            if live_info['is_in_stock']:
+                any_variant_in_stock = True
+            # Title consistency check (optional)
+            if live_info.get('title') and live_info['title'].lower() != feed_variant.get('size','').lower():
+                logger.debug(f"  Variant with SKU {sku} has title mismatch: Page='{live_info.get('title')}', using standardized format for consistency.")
+        else:
+            feed_variant['is_variation_in_stock'] = False # Assume OOS if not found on page / no SKU match
+            logger.warning(f"  SKU '{sku}' not found or no stock info on page {atom_product_data['url']}.")
+
+        updated_variants.append(feed_variant)
+
+    atom_product_data['variations'] = updated_variants
+    atom_product_data['is_in_stock'] = any_variant_in_stock
+    return atom_product_data
+
+
+# Resource types aborted during fallback page loads — not needed to
+# read the embedded product JSON out of the document.
+_BLOCKED_RESOURCE_TYPES = {"image", "font", "stylesheet", "media"}
+
+# Analytics/tracking hosts that contribute nothing to the scrape
+_BLOCKED_URL_FRAGMENTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "hotjar.com",
+    "facebook.net",
+    "doubleclick.net",
+)
+
+
+async def _abort_heavy_resources(route):
+    """Route handler that drops images/fonts/CSS/media and trackers."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    elif any(fragment in request.url for fragment in _BLOCKED_URL_FRAGMENTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _scrape_details_concurrently(products_to_process, config):
+    """
+    Fetch live stock details for all products in two phases.
+
+    Phase one hits Shopify's product JSON endpoint for every product
+    through a bounded pool of plain HTTP workers — no browser involved,
+    so up to MAX_CONCURRENT_PAGES cheap requests overlap. Only products
+    the endpoint cannot serve go through phase two, which launches
+    Playwright and digs the embedded JSON out of the rendered page. In
+    the common case every product resolves in phase one and no browser
+    is ever started. The politeness delay applies per worker slot in
+    both phases, keeping the request rate comparable to the old
+    sequential loop.
+
+    Returns:
+        list: Final product entries, in the same order as the input.
+    """
+    total = len(products_to_process)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+    # Phase one: stateless HTTP workers against the JSON endpoint
+    async def fetch_one_via_api(index, atom_product_data):
+        async with semaphore:
+            logger.info(f"\nProcessing product {index+1}/{total} for details: {atom_product_data['title']} ({atom_product_data['url']})" )
+            await asyncio.sleep(config.get_request_delay()) # Configurable politeness delay
+            return await fetch_product_stock_via_api(atom_product_data['url'])
+
+    stock_infos = list(await asyncio.gather(
+        *(fetch_one_via_api(i, product) for i, product in enumerate(products_to_process))
+    ))
+
+    # Phase two: browser fallback, only for products the endpoint missed
+    miss_indices = [i for i, info in enumerate(stock_infos) if not info]
+    if miss_indices:
+        logger.info(f"{len(miss_indices)} of {total} products missing JSON endpoint data; falling back to page scrapes.")
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=HEADLESS)
+            context = await browser.new_context(
+                user_agent=USER_AGENT,
+                java_script_enabled=True,
+                accept_downloads=False,
+            )
+            # Only the document and its scripts matter for the embedded
+            # JSON; images, fonts, CSS and media are dead weight here.
+            await context.route("**/*", _abort_heavy_resources)
+
+            async def scrape_one_via_page(index):
+                async with semaphore:
+                    await asyncio.sleep(config.get_request_delay()) # Configurable politeness delay
+                    page = await context.new_page()
+                    try:
+                        return await scrape_product_page_details(page, products_to_process[index]['url'])
+                    except Exception as e:
+                        logger.error(f"Failed to scrape product page details: {e}")
+                        return {}
+                    finally:
+                        await page.close()
+
+            try:
+                fallback_infos = await asyncio.gather(
+                    *(scrape_one_via_page(i) for i in miss_indices)
+                )
+            finally:
+                logger.info("Closing browser.")
+                await browser.close()
+
+        for index, info in zip(miss_indices, fallback_infos):
+            stock_infos[index] = info
+
+    return [
+        _apply_live_stock_info(product, info)
+        for product, info in zip(products_to_process, stock_infos)
+    ]
+
+
 def main():
     """Main function to orchestrate the scraping process."""
     logger.info("Starting Damseeds scraper main process.")
     overall_start_time = time.time()
-    
+
     # Initialize scraping configuration
     config = ScrapingConfig(SPEED_MODE)
     logger.info(f"Using speed mode: {SPEED_MODE} (delay: {config.get_request_delay()}s, timeout: {config.get_page_timeout()}ms)")
@@ -417,85 +854,41 @@ def main():
         return
 
     # Products parsed from the Atom feed (basic info)
-    atom_products = parse_products_from_feed(feed_content)
+    # An unchanged feed (same ETag as last run) reuses the parsed list
+    feed_meta = _load_feed_cache()
+    feed_etag = feed_meta.get('etag') if feed_meta else None
+    atom_products = _load_parsed_cache(feed_etag)
+    if atom_products is not None:
+        logger.info(f"Feed ETag unchanged; reusing {len(atom_products)} parsed products from cache.")
+    else:
+        atom_products = parse_products_from_feed(feed_content)
+        _save_parsed_cache(feed_etag, atom_products)
 
     if not atom_products:
         logger.info("No products found in the Atom feed. Exiting.")
         return
 
-    detailed_products = []
-    playwright_headless_mode = HEADLESS
-    logger.info(f"Playwright headless mode: {playwright_headless_mode}")
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=playwright_headless_mode)
-        context = browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36",
-            java_script_enabled=True,
-            accept_downloads=False,
-        )
-        page = context.new_page()
+    logger.info(f"Playwright headless mode: {HEADLESS}")
 
-        products_to_process_details_for = atom_products
-        if TEST_MODE:
-            test_count = min(5, len(atom_products))
-            products_to_process_details_for = random.sample(atom_products, test_count)
-            logger.info(f"TEST_MODE is True. Randomly selected {test_count} products for testing.")
-            for i, product in enumerate(products_to_process_details_for):
-                logger.info(f"  Test product {i+1}: {product['title']}")
+    products_to_process_details_for = atom_products
+    if TEST_MODE:
+        test_count = min(5, len(atom_products))
+        products_to_process_details_for = random.sample(atom_products, test_count)
+        logger.info(f"TEST_MODE is True. Randomly selected {test_count} products for testing.")
+        for i, product in enumerate(products_to_process_details_for):
+            logger.info(f"  Test product {i+1}: {product['title']}")
 
-        for i, atom_product_data in enumerate(products_to_process_details_for):
-            logger.info(f"\nProcessing product {i+1}/{len(products_to_process_details_for)} for details: {atom_product_data['title']} ({atom_product_data['url']})" )
-            time.sleep(config.get_request_delay()) # Configurable politeness delay
+    final_entries = asyncio.run(
+        _scrape_details_concurrently(products_to_process_details_for, config)
+    )
 
-            # Scrape the live product page for stock details
-            try:
-                live_variant_stock_info = scrape_product_page_details(page, atom_product_data['url'])
-            except Exception as e:
-                logger.error(f"Failed to scrape product page details: {e}")
-                live_variant_stock_info = {}
-
-            # Update variants from Atom feed with live stock info
-            updated_variants = []
-            any_variant_in_stock = False
-            for feed_variant in atom_product_data.get('variations', []):
-                # Skip packet variations (already filtered in feed parsing, but double-check)
-                if feed_variant.get('size', '').lower().strip() == "packet":
-                    continue
-                    
-                sku = feed_variant.get('sku')
-                live_info = live_variant_stock_info.get(sku) if sku else None
-                
-                current_variant_data = feed_variant.copy() # Start with feed data
-                if live_info:
-                    current_variant_data['is_variation_in_stock'] = live_info['is_in_stock']
-                    if live_info['is_in_stock']:
-                        any_variant_in_stock = True
-                    # Title consistency check (optional)
-                    if live_info.get('title') and live_info['title'].lower() != feed_variant.get('size','').lower():
-                        logger.debug(f"  Variant with SKU {sku} has title mismatch: Page='{live_info.get('title')}', using standardized format for consistency.")
-                else:
-                    current_variant_data['is_variation_in_stock'] = False # Assume OOS if not found on page / no SKU match
-                    logger.warning(f"  SKU '{sku}' not found or no stock info on page {atom_product_data['url']}.")
-                
-                # Remove any old stock status fields if they exist
-                current_variant_data.pop('stock_status_from_feed', None) 
-                updated_variants.append(current_variant_data)
-            
-            # Create the final product entry
-            final_product_entry = atom_product_data.copy()
-            final_product_entry['variations'] = updated_variants
-            final_product_entry['is_in_stock'] = any_variant_in_stock
-            final_product_entry.pop('stock_status_from_feed', None) # Remove old product-level status
-
-            # Validate product data
-            if validate_product_data(final_product_entry, logger):
-                detailed_products.append(final_product_entry)
-            else:
-                logger.warning(f"Product failed validation: {final_product_entry.get('title')}")
-
-        logger.info("Closing browser.")
-        browser.close()
+    # Validate product data
+    detailed_products = []
+    for final_product_entry in final_entries:
+        if validate_product_data(final_product_entry, logger):
+            detailed_products.append(final_product_entry)
+        else:
+            logger.warning(f"Product failed validation: {final_product_entry.get('title')}")
 
     core_scrape_duration_seconds = time.time() - overall_start_time
 
@@ -3,6 +3,7 @@ Shared utilities for all scrapers in the Sprouting.com project.
 Centralizes common functionality to reduce code duplication.
 """
 
+import asyncio
 import os
 import json
 import logging
@@ -10,11 +11,17 @@ import re
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 from logging.handlers import RotatingFileHandler
+import tempfile
 import time
-from functools import wraps
+from functools import lru_cache, wraps
 import requests
 from urllib.parse import urljoin, urlparse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def setup_logging(scraper_name: str, log_dir: str = "logs") -> logging.Logger:
     """
@@ -131,11 +138,29 @@ def retry_on_failure(max_attempts: int = 3, delay: float = 1.0, backoff: float =
         backoff: Multiplier for delay after each retry
     """
     def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                last_exception = None
+                current_delay = delay
+
+                for attempt in range(max_attempts):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        last_exception = e
+                        if attempt < max_attempts - 1:
+                            await asyncio.sleep(current_delay)
+                            current_delay *= backoff
+
+                raise last_exception
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             last_exception = None
             current_delay = delay
-            
+
             for attempt in range(max_attempts):
                 try:
                     return func(*args, **kwargs)
@@ -144,68 +169,75 @@ def retry_on_failure(max_attempts: int = 3, delay: float = 1.0, backoff: float =
                     if attempt < max_attempts - 1:
                         time.sleep(current_delay)
                         current_delay *= backoff
-                    
+
             raise last_exception
         return wrapper
     return decorator
 
 
+# Conversion factors to kg for parse_weight_from_string
+_WEIGHT_CONVERSIONS = {
+    'kg': 1.0,
+    'kgs': 1.0,
+    'kilo': 1.0,
+    'kilos': 1.0,
+    'killos': 1.0,  # Handle typo variant
+    'kilogram': 1.0,
+    'kilograms': 1.0,
+    'g': 0.001,
+    'gr': 0.001,
+    'gs': 0.001,  # Add support for "gs" abbreviation
+    'gram': 0.001,
+    'grams': 0.001,
+    'lb': 0.453592,
+    'lbs': 0.453592,
+    'pound': 0.453592,
+    'pounds': 0.453592,
+    'oz': 0.0283495,
+    'ounce': 0.0283495,
+    'ounces': 0.0283495
+}
+
+_WEIGHT_UNITS = r'kg|kgs|kilo|kilos|killos|gs|g|gr|gram|grams|lb|lbs|pound|pounds|oz|ounce|ounces'
+
+# Compiled once at import - fractions MUST come first, then multiplication
+# patterns. Each entry carries a flag marking the fraction pattern.
+_WEIGHT_PATTERNS = [
+    (re.compile(r'(\d+)/(\d+)\s*(' + _WEIGHT_UNITS + r')'), True),  # Fractions (FIRST)
+    (re.compile(r'(\d+(?:\.\d+)?)\s*x\s*(\d+(?:\.\d+)?)\s*(' + _WEIGHT_UNITS + r')'), False),  # Multiple weights (SECOND)
+    (re.compile(r'(\d+(?:\.\d+)?)\s*x\s*(\d+(?:\.\d+)?)\s*(?:kilogram|kilograms)'), False),  # Multiple kilograms (THIRD)
+    (re.compile(r'(\d+(?:\.\d+)?)\s*(' + _WEIGHT_UNITS + r')'), False),  # Single weight
+    (re.compile(r'(\d+(?:\.\d+)?)\s*(?:kilogram|kilograms)'), False)  # Kilogram without abbreviation
+]
+
+
+@lru_cache(maxsize=4096)
 def parse_weight_from_string(weight_str: str) -> Tuple[Optional[float], Optional[float], Optional[str]]:
     """
     Parse weight information from a string and convert to kilograms.
-    
+
+    Cached: variant size strings ("25g", "100g", "1 kg") repeat across
+    products, so most calls after the first are dict hits.
+
     Args:
         weight_str: String containing weight information
-        
+
     Returns:
         Tuple of (weight_in_kg, original_value, original_unit)
     """
     if not weight_str:
         return None, None, None
-    
+
     # Clean the string
     weight_str = weight_str.lower().strip()
-    
-    # Define conversion factors to kg
-    conversions = {
-        'kg': 1.0,
-        'kgs': 1.0,
-        'kilo': 1.0,
-        'kilos': 1.0,
-        'killos': 1.0,  # Handle typo variant
-        'kilogram': 1.0,
-        'kilograms': 1.0,
-        'g': 0.001,
-        'gr': 0.001,
-        'gs': 0.001,  # Add support for "gs" abbreviation
-        'gram': 0.001,
-        'grams': 0.001,
-        'lb': 0.453592,
-        'lbs': 0.453592,
-        'pound': 0.453592,
-        'pounds': 0.453592,
-        'oz': 0.0283495,
-        'ounce': 0.0283495,
-        'ounces': 0.0283495
-    }
-    
-    # Try different patterns - fractions MUST come first, then multiplication patterns
-    patterns = [
-        r'(\d+)/(\d+)\s*(kg|kgs|kilo|kilos|killos|gs|g|gr|gram|grams|lb|lbs|pound|pounds|oz|ounce|ounces)',  # Fractions (FIRST)
-        r'(\d+(?:\.\d+)?)\s*x\s*(\d+(?:\.\d+)?)\s*(kg|kgs|kilo|kilos|killos|gs|g|gr|gram|grams|lb|lbs|pound|pounds|oz|ounce|ounces)',  # Multiple weights (SECOND)
-        r'(\d+(?:\.\d+)?)\s*x\s*(\d+(?:\.\d+)?)\s*(?:kilogram|kilograms)',  # Multiple kilograms (THIRD)
-        r'(\d+(?:\.\d+)?)\s*(kg|kgs|kilo|kilos|killos|gs|g|gr|gram|grams|lb|lbs|pound|pounds|oz|ounce|ounces)',  # Single weight
-        r'(\d+(?:\.\d+)?)\s*(?:kilogram|kilograms)'  # Kilogram without abbreviation
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, weight_str)
+
+    for pattern, is_fraction in _WEIGHT_PATTERNS:
+        match = pattern.search(weight_str)
         if match:
             groups = match.groups()
-            
+
             # Check if this is a fraction pattern (3 groups where first two are numbers)
-            if (len(groups) == 3 and 
-                pattern.startswith(r'(\d+)/(\d+)') and 
+            if (is_fraction and len(groups) == 3 and
                 groups[0].isdigit() and groups[1].isdigit()):
                 # Handle fractions (e.g., "1/4 pound")
                 numerator = float(groups[0])
@@ -229,8 +261,8 @@ def parse_weight_from_string(weight_str: str) -> Tuple[Optional[float], Optional
                 continue
                 
             # Convert to kg
-            if unit in conversions:
-                weight_kg = total_weight * conversions[unit]
+            if unit in _WEIGHT_CONVERSIONS:
+                weight_kg = total_weight * _WEIGHT_CONVERSIONS[unit]
                 # Normalize "killos" typo to "kilos"
                 normalized_unit = "kilos" if unit == "killos" else unit
                 return weight_kg, original_value, normalized_unit
@@ -506,10 +538,28 @@ def save_products_to_json(
         "data": products
     }
     
-    # Save to JSON
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    
+    # Save to JSON atomically: encode into a temp file in the same
+    # directory, then os.replace over the target so concurrent readers
+    # (e.g. the sprouting pipeline) never see a half-written file.
+    # orjson serializes natively in one pass, falling back to stdlib
+    # json when it isn't installed.
+    tmp_fd, tmp_path = tempfile.mkstemp(dir=output_dir, suffix='.json.tmp')
+    try:
+        if orjson is not None:
+            with os.fdopen(tmp_fd, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with os.fdopen(tmp_fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        os.chmod(tmp_path, 0o644)  # mkstemp defaults to 0600
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
     if logger:
         logger.info(f"Saved {len(products)} products to {filepath}")
     
@@ -78,6 +78,40 @@ CULTIVAR_INDICATORS = [
     "4010",
 ]
 
+# Precompiled once at import so the per-title parse doesn't pay the
+# re-cache lookup and flag parsing on every call
+_ORGANIC_RE = re.compile(r'\b(organic|biologique)\b', re.IGNORECASE)
+
+# Per-key word-boundary patterns compiled once at import; the loops in
+# _parse_seed_name_internal keep dict order (longer keys like
+# "swiss chard" are listed before "chard") but no longer recompile
+# per title. The single alternation below answers "does any mapping
+# key appear at all?" in one scan so titles with no known name skip
+# the per-key loops entirely.
+_MAPPING_KEY_RES = {
+    key: re.compile(r'\b' + re.escape(key) + r'\b', re.IGNORECASE)
+    for key in COMMON_NAME_MAPPING
+}
+_MAPPING_ANY_RE = re.compile(
+    r'\b(?:' + '|'.join(
+        re.escape(k) for k in sorted(COMMON_NAME_MAPPING, key=len, reverse=True)
+    ) + r')\b',
+    re.IGNORECASE
+)
+_CULTIVAR_INDICATOR_RES = {
+    indicator: re.compile(r'\b' + re.escape(indicator) + r'\b', re.IGNORECASE)
+    for indicator in CULTIVAR_INDICATORS
+}
+# Mapping items ordered longest key first, for longest-match-wins scans
+_MAPPING_BY_LENGTH = sorted(
+    COMMON_NAME_MAPPING.items(), key=lambda x: len(x[0]), reverse=True
+)
+# Title cleanup patterns, each consuming its surrounding whitespace so
+# no extra strip() passes are needed between them
+_WS_RE = re.compile(r'\s+')
+_SEED_SUFFIX_RE = re.compile(r'\s+(?:seeds|seed)$', re.IGNORECASE)
+_TRAILING_COMMA_RE = re.compile(r'\s*,\s*$')
+
 def load_known_common_names(csv_path):
     """
     Load known common names from a CSV file.
@@ -110,24 +144,27 @@ def _parse_seed_name_internal(product_title, known_common_names=None):
             "additional_descriptors": "N/A"
         }
     
-    # Remove "organic" or "biologique" and clean up whitespace
-    processed_title = re.sub(r'\b(organic|biologique)\b', '', product_title, flags=re.IGNORECASE).strip()
-    processed_title = ' '.join(processed_title.split())  # Normalize spaces
-    
-    # Remove "seeds" or "seed" from the end
-    processed_title = re.sub(r'\s+(seeds|seed)$', '', processed_title, flags=re.IGNORECASE).strip()
-    
-    # Clean trailing commas and extra spaces from the title
-    processed_title = re.sub(r',\s*$', '', processed_title).strip()
-    
+    # Remove "organic" or "biologique", collapse whitespace in a single
+    # pass, then trim the "seeds"/"seed" suffix and any trailing comma.
+    # All four patterns are precompiled and whitespace-consuming, so the
+    # old interleaved strip()/split()/join() passes are gone.
+    processed_title = _ORGANIC_RE.sub('', product_title)
+    processed_title = _WS_RE.sub(' ', processed_title).strip()
+    processed_title = _SEED_SUFFIX_RE.sub('', processed_title)
+    processed_title = _TRAILING_COMMA_RE.sub('', processed_title)
+    
+    # One scan tells us whether any mapping key appears; if none does,
+    # the per-key loops in steps below can be skipped outright
+    has_mapping_key = _MAPPING_ANY_RE.search(processed_title) is not None
+
     # Special case for titles like "Greencrops, 4010 Green Forage Pea - Organic"
     # Check for known common names embedded in the title
-    for key, value in COMMON_NAME_MAPPING.items():
-        if re.search(r'\b' + re.escape(key) + r'\b', processed_title, re.IGNORECASE):
+    for key, value in COMMON_NAME_MAPPING.items() if has_mapping_key else ():
+        if _MAPPING_KEY_RES[key].search(processed_title):
             # Found a common name within the title
             # Check if this is a special case with a cultivar indicator at the beginning
             for indicator in CULTIVAR_INDICATORS:
-                if re.search(r'\b' + re.escape(indicator) + r'\b', processed_title, re.IGNORECASE):
+                if _CULTIVAR_INDICATOR_RES[indicator].search(processed_title):
                     # This appears to be a title with a cultivar indicator and an embedded common name
                     # Extract the cultivar part (anything before the common name or between commas/dashes)
                     cultivar_part = ""
@@ -226,9 +263,11 @@ def _parse_seed_name_internal(product_title, known_common_names=None):
                     }
             
             # Special case: Handle "Greens," prefix pattern that indicates the common name is in the right part
-            if left_part.lower().strip() == "greens":
+            # Lowercase once here; the branches below all test against it
+            if left_part.lower() == "greens":
+                right_lower = right_part.lower()
                 # Check for specific plant names FIRST before checking mapping
-                if 'amaranth' in right_part.lower():
+                if 'amaranth' in right_lower:
                     # Extract cultivar from titles like "Red Garnet Amaranth"
                     amaranth_match = re.search(r'(.+?)\s+amaranth', right_part, re.IGNORECASE)
                     if amaranth_match:
@@ -236,19 +275,18 @@ def _parse_seed_name_internal(product_title, known_common_names=None):
                         return {"common_name": "Amaranth", "cultivar_name": cultivar, "additional_descriptors": "N/A"}
                     else:
                         return {"common_name": "Amaranth", "cultivar_name": "N/A", "additional_descriptors": "N/A"}
-                elif 'mizuna' in right_part.lower():
+                elif 'mizuna' in right_lower:
                     return {"common_name": "Mizuna", "cultivar_name": "N/A", "additional_descriptors": "N/A"}
-                elif 'komatsuna' in right_part.lower():
+                elif 'komatsuna' in right_lower:
                     return {"common_name": "Komatsuna", "cultivar_name": "N/A", "additional_descriptors": "N/A"}
-                elif 'garden cress' in right_part.lower() or 'peppergrass' in right_part.lower():
+                elif 'garden cress' in right_lower or 'peppergrass' in right_lower:
                     return {"common_name": "Cress", "cultivar_name": "Peppergrass", "additional_descriptors": "N/A"}
                 
                 # Look for actual common name in the right part (longest match first)
-                sorted_mapping = sorted(COMMON_NAME_MAPPING.items(), key=lambda x: len(x[0]), reverse=True)
-                for key, value in sorted_mapping:
-                    if re.search(r'\b' + re.escape(key) + r'\b', right_part, re.IGNORECASE):
+                for key, value in _MAPPING_BY_LENGTH:
+                    if _MAPPING_KEY_RES[key].search(right_part):
                         # Remove the matched common name from right part to get cultivar
-                        remaining_right = re.sub(r'\b' + re.escape(key) + r'\b', '', right_part, flags=re.IGNORECASE).strip()
+                        remaining_right = _MAPPING_KEY_RES[key].sub('', right_part).strip()
                         remaining_right = re.sub(r'^[,\-\s]+|[,\-\s]+$', '', remaining_right).strip()  # Clean punctuation
                         return {
                             "common_name": value,
@@ -266,10 +304,10 @@ def _parse_seed_name_internal(product_title, known_common_names=None):
             # If the first part is not a common name, check if it's a cultivar indicator
             # and look for common names in the right part
             for indicator in CULTIVAR_INDICATORS:
-                if re.search(r'\b' + re.escape(indicator) + r'\b', left_part, re.IGNORECASE):
+                if _CULTIVAR_INDICATOR_RES[indicator].search(left_part):
                     # This is likely a cultivar indicator, search for common name in right part
                     for key, value in COMMON_NAME_MAPPING.items():
-                        if re.search(r'\b' + re.escape(key) + r'\b', right_part, re.IGNORECASE):
+                        if _MAPPING_KEY_RES[key].search(right_part):
                             return {
                                 "common_name": value,
                                 "cultivar_name": left_part,
@@ -310,8 +348,8 @@ def _parse_seed_name_internal(product_title, known_common_names=None):
                     }
     
     # Step 4: Check COMMON_NAME_MAPPING for matches in the title
-    for common_name_key, common_name_value in COMMON_NAME_MAPPING.items():
-        pattern = re.compile(r'\b' + re.escape(common_name_key) + r'\b', re.IGNORECASE)
+    for common_name_key, common_name_value in COMMON_NAME_MAPPING.items() if has_mapping_key else ():
+        pattern = _MAPPING_KEY_RES[common_name_key]
         if pattern.search(processed_title):
             # Found a common name, extract the rest as potential cultivar/descriptors
             remaining = pattern.sub('', processed_title).strip()
@@ -404,6 +442,19 @@ def parse_seed_name(product_title, known_common_names=None):
     result = _parse_seed_name_internal(product_title, known_common_names)
     return clean_parse_result(result)
 
+def parse_seed_names(product_titles, known_common_names=None):
+    """
+    Parse a batch of product titles in one call.
+
+    Args:
+        product_titles (list): Product titles to parse
+        known_common_names (list): Optional list of known common names
+
+    Returns:
+        list: One parse_seed_name() result dict per title, in input order
+    """
+    return [parse_seed_name(title, known_common_names) for title in product_titles]
+
 def extract_common_name(text, known_common_names=None):
     """Extract common name from text."""
     if not text:
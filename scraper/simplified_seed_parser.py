@@ -78,16 +78,37 @@ SPECIAL_CASES = {
     }
 }
 
+# Precompiled at import: single alternations scan a title once instead of
+# one re.sub pass per term, and stay linear-time for any input title.
+_IGNORE_TERMS_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(term) for term in IGNORE_TERMS) + r')\b',
+    re.IGNORECASE
+)
+_CULTIVAR_CLEANERS_RE = re.compile('|'.join(CULTIVAR_CLEANERS), re.IGNORECASE)
+_WS_RE = re.compile(r'\s+')
+
 # Cache for common names to avoid repeated disk reads
 _COMMON_NAMES = None
 
+# Compiled word-boundary pattern per known common name, built alongside
+# the common-name cache so the hot matching loop skips re.compile
+_COMMON_NAME_PATTERNS = None
+
+def _compile_common_name_patterns(common_names):
+    """Build the per-name compiled patterns used by parse_seed_title."""
+    global _COMMON_NAME_PATTERNS
+    _COMMON_NAME_PATTERNS = [
+        (name, re.compile(r'\b' + re.escape(name.lower()) + r'\b', re.IGNORECASE))
+        for name in common_names
+    ]
+
 def load_common_names():
     """Load common names from CSV file or use defaults."""
     global _COMMON_NAMES
-    
+
     if _COMMON_NAMES is not None:
         return _COMMON_NAMES
-    
+
     try:
         common_names = []
         if os.path.exists(COMMON_NAMES_CSV_FILEPATH):
@@ -102,18 +123,22 @@ def load_common_names():
             common_names = DEFAULT_COMMON_NAMES
             logger.info(f"Using {len(common_names)} default common names")
         
-        # Add name equivalents to the list
+        # Add name equivalents to the list; probe a lowercased set built
+        # once instead of rebuilding the list per equivalent
+        names_lower = frozenset(name.lower() for name in common_names)
         for equiv in NAME_EQUIVALENTS.keys():
-            if equiv not in [name.lower() for name in common_names]:
+            if equiv not in names_lower:
                 common_names.append(equiv.title())
         
         # Sort by length (longest first) to prioritize more specific matches
         _COMMON_NAMES = sorted(common_names, key=len, reverse=True)
+        _compile_common_name_patterns(_COMMON_NAMES)
         return _COMMON_NAMES
-    
+
     except Exception as e:
         logger.error(f"Error loading common names: {e}")
         _COMMON_NAMES = DEFAULT_COMMON_NAMES
+        _compile_common_name_patterns(_COMMON_NAMES)
         return _COMMON_NAMES
 
 def clean_title(title):
@@ -123,17 +148,14 @@ def clean_title(title):
     
     # Convert to lowercase for case-insensitive matching
     title_lower = title.lower()
-    
-    # Remove ignore terms
-    for term in IGNORE_TERMS:
-        # Use word boundary to match whole words only
-        pattern = r'\b' + re.escape(term) + r'\b'
-        title_lower = re.sub(pattern, '', title_lower, flags=re.IGNORECASE)
-    
+
+    # Remove all ignore terms in one alternation pass
+    title_lower = _IGNORE_TERMS_RE.sub('', title_lower)
+
     # Clean up whitespace and punctuation
-    title_lower = re.sub(r'\s+', ' ', title_lower).strip()
+    title_lower = _WS_RE.sub(' ', title_lower).strip()
     title_lower = title_lower.strip('.,;:-')
-    
+
     return title_lower
 
 def clean_cultivar_name(cultivar):
@@ -148,18 +170,13 @@ def clean_cultivar_name(cultivar):
     
     # Convert to lowercase for processing
     result = cultivar.lower()
-    
-    # Remove ignore terms
-    for term in IGNORE_TERMS:
-        pattern = r'\b' + re.escape(term) + r'\b'
-        result = re.sub(pattern, '', result, flags=re.IGNORECASE)
-    
-    # Remove cultivar cleaners
-    for pattern in CULTIVAR_CLEANERS:
-        result = re.sub(pattern, '', result, flags=re.IGNORECASE)
-    
+
+    # Remove ignore terms and cultivar cleaners, one alternation pass each
+    result = _IGNORE_TERMS_RE.sub('', result)
+    result = _CULTIVAR_CLEANERS_RE.sub('', result)
+
     # Clean up whitespace and punctuation
-    result = re.sub(r'\s+', ' ', result).strip()
+    result = _WS_RE.sub(' ', result).strip()
     result = result.strip('.,;:-')
     
     # Title case the result for nice formatting
@@ -240,19 +257,18 @@ def parse_seed_title(title):
     if special_case:
         return special_case
     
-    # Load common names
-    common_names = load_common_names()
-    
+    # Load common names (also builds the compiled patterns)
+    load_common_names()
+
     # Clean the title
     cleaned_title = clean_title(title)
     original_title = title
-    
+
     # Step 1: Look for common names in the title
     found_common_name = None
-    
-    for common_name in common_names:
-        pattern = r'\b' + re.escape(common_name.lower()) + r'\b'
-        if re.search(pattern, cleaned_title, re.IGNORECASE):
+
+    for common_name, pattern in _COMMON_NAME_PATTERNS:
+        if pattern.search(cleaned_title):
             found_common_name = common_name
             break
     
@@ -364,6 +380,22 @@ def parse_seed_title(title):
         "cultivar_name": "N/A"
     }
 
+def parse_seed_titles(titles):
+    """
+    Parse a batch of product titles in one call.
+
+    Loads the common-name list once up front so per-title calls skip the
+    cache check, and returns results in input order.
+
+    Args:
+        titles (list): Product titles to parse
+
+    Returns:
+        list: One parse_seed_title() result dict per title
+    """
+    load_common_names()  # Warm the cache before the batch loop
+    return [parse_seed_title(title) for title in titles]
+
 def format_seed_name(common_name, cultivar_name):
     """Format seed name according to convention: Common Name 'Cultivar Name'"""
     if common_name == "N/A":
@@ -9,9 +9,15 @@ import json
 import time
 import logging
 from datetime import datetime
+from io import BytesIO
 from typing import Dict, List, Any
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
 from seed_name_parser import parse_with_botanical_field_names
 from scraper_utils import (
     setup_logging, parse_weight_from_string, standardize_size_format,
@@ -32,9 +38,34 @@ TARGET_COLLECTIONS = [
     "wholesale-sprouting-seed"
 ]
 
+# Atom namespace used by Shopify collection feeds
+_ATOM_NS = 'http://www.w3.org/2005/Atom'
+_ATOM_ENTRY_TAG = '{%s}entry' % _ATOM_NS
+
 # --- Setup Logger ---
 logger = setup_logging("trueleafmarket_scraper")
 
+
+def _iter_atom_entries(page_content: str):
+    """
+    Yield <entry> elements from Atom feed content.
+
+    Streams through lxml's C-backed iterparse when available, clearing
+    each entry (and its consumed siblings) once yielded so memory stays
+    flat on large feeds. Falls back to stdlib ElementTree otherwise.
+    """
+    if lxml_etree is not None:
+        data = page_content.encode('utf-8') if isinstance(page_content, str) else page_content
+        for _, entry in lxml_etree.iterparse(BytesIO(data), events=('end',), tag=_ATOM_ENTRY_TAG):
+            yield entry
+            entry.clear()
+            while entry.getprevious() is not None:
+                del entry.getparent()[0]
+    else:
+        import xml.etree.ElementTree as ET
+        root = ET.fromstring(page_content)
+        yield from root.iter(_ATOM_ENTRY_TAG)
+
 class TrueLeafMarketScraper:
     """Playwright-based scraper for True Leaf Market"""
     
@@ -770,31 +801,18 @@ class TrueLeafMarketScraper:
         """Extract products from XML Atom feed"""
         products = []
         try:
-            import xml.etree.ElementTree as ET
-            
-            # Parse XML content
-            root = ET.fromstring(page_content)
-            
-            # Handle namespaces
-            namespaces = {
-                'atom': 'http://www.w3.org/2005/Atom',
-                '': 'http://www.w3.org/2005/Atom'
-            }
-            
-            # Find all entries (products)
-            entries = root.findall('.//entry', namespaces)
-            logger.info(f"Found {len(entries)} entries in atom feed")
-            
-            for entry in entries:
+            entry_count = 0
+            for entry in _iter_atom_entries(page_content):
+                entry_count += 1
                 try:
                     # Extract product title
-                    title_elem = entry.find('title', namespaces)
+                    title_elem = entry.find('{%s}title' % _ATOM_NS)
                     title = title_elem.text if title_elem is not None else ""
-                    
+
                     # Extract product URL
-                    link_elem = entry.find('link[@rel="alternate"]', namespaces)
+                    link_elem = entry.find('{%s}link[@rel="alternate"]' % _ATOM_NS)
                     if link_elem is None:
-                        link_elem = entry.find('link', namespaces)
+                        link_elem = entry.find('{%s}link' % _ATOM_NS)
                     
                     url = link_elem.get('href') if link_elem is not None else ""
                     if url and not url.startswith('http'):
@@ -823,8 +841,8 @@ class TrueLeafMarketScraper:
                     
         except Exception as e:
             logger.error(f"Error parsing atom feed: {e}")
-        
-        logger.info(f"Extracted {len(products)} products from atom feed")
+
+        logger.info(f"Extracted {len(products)} products from {entry_count} atom feed entries")
         return products
     
     def scrape_all_collections(self) -> List[Dict[str, Any]]: